@@ -7,18 +7,36 @@ import cv2
 import numpy as np
 from PySide6 import QtCore, QtGui
 
-from capture.dxcam_backend import DXCamCapture
+from capture.change_map import TileChangeDetector
+from capture.recorder import FrameRecorder
+from capture.replay_backend import ReplayCapture
 from input.caption_server import CaptionServer
 from input.clipboard_watcher import ClipboardWatcher
-from ocr.paddleocr_engine import PaddleOCREngine
-from ocr.rapidocr_engine import RapidOCREngine
-from translate.argos_engine import ArgosTranslator
-from translate.ct2_cascade import CT2CascadeTranslator
-from translate.ct2_engine import CT2Translator
-from translate.ct2_nllb import CT2NLLBTranslator
-from utils.cache import LRUCache
+from ocr.box_reuse import BoxReuseOCREngine
+from ocr.factory import create_ocr_engine, warmup_ocr_engine
+from ocr.line_cache import LineRecognitionCache
+from ocr.postprocess import expand_region, merge_layout, offset_result, ocr_result_to_text
+from ocr.process_engine import ProcessOCREngine
+from translate.factory import (
+    ENGINE_LABELS,
+    create_translator,
+    engine_name,
+    uses_gpu,
+    warmup_translator,
+)
+from translate.incremental import PrefixTracker
+from utils import startup
+from utils.buffer_pool import BufferPool
+from utils.cache import LRUCache, PersistentCache, TranslationCache
+from utils.fuzzy_index import FuzzyIndex
+from utils.metrics import PipelineMetrics
+from utils.model_registry import get_model_registry
+from utils.paths import resolve_path
+from utils.reveal_stabilizer import RevealStabilizer
+from utils.scheduler import AdaptiveRate, TokenBucket, TranslationScheduler
 from utils.sentence_buffer import SentenceBuffer
-from utils.text import normalize_text, similarity
+from utils.similarity import similarity_at_least
+from utils.text import normalize_text
 from utils.win_process import get_foreground_process_path, paths_match
 
 
@@ -45,18 +63,113 @@ class PipelineController(QtCore.QObject):
         self._text_hook_re = None
         self._text_hook_debug = False
         self._text_hook_status_last = ""
-        self._threads = []
+        self._translate_threads = []
+        self._translate_bucket = None
+        self._ocr_thread = None
         self._stop_event = threading.Event()
-        self._text_queue = None
+        self._input_stop = None
+        self._input_paused = threading.Event()
+        self._capture_monitor = None
+        self._capture_generation = 0
+        self._scheduler = None
+        self._emit_lock = threading.Lock()
+        self._last_emitted_seq = 0
+        self._stream_cfg = config["pipeline"].get("streaming", {})
+        self._incremental_cfg = config["pipeline"].get("incremental", {})
+        self._prefix_tracker = None
+        self._last_preview = ""
         self._cache = None
         self._last_ocr_text = ""
         self._sentence_buffer = None
+        self._stabilizer = None
+        self._buffers = BufferPool()
+        models_cfg = config["pipeline"].get("models", {})
+        self._keep_models = models_cfg.get("keep_loaded", True)
+        self._warmup_models = models_cfg.get("warmup", True)
+        self._preload_thread = None
+        self._models = get_model_registry()
+        self._models.configure(min_free_mb=int(models_cfg.get("min_free_mb", 0)))
+        metrics_cfg = config["pipeline"].get("metrics", {})
+        self._metrics = PipelineMetrics(
+            window=int(metrics_cfg.get("window", 2048)),
+            enabled=metrics_cfg.get("enabled", True),
+        )
+
+    def preload(self) -> None:
+        if self._preload_thread and self._preload_thread.is_alive():
+            return
+        self._preload_thread = threading.Thread(target=self._preload_models, daemon=True)
+        self._preload_thread.start()
+
+    def _preload_models(self) -> None:
+        translator = self._create_translator(self._config["translate"])
+        if translator.error:
+            self.status.emit(f"Translate preload failed: {translator.error}")
+        if self._config.get("input", {}).get("mode", "ocr") == "ocr":
+            engine = self._ocr_model(self._config["ocr"])
+            if engine.error:
+                self.status.emit(f"OCR preload failed: {engine.error}")
+        startup.mark("models_ready")
+
+    @property
+    def running(self) -> bool:
+        return bool(self._translate_threads) or self._input_stop is not None
 
     def start(self, roi_logical) -> None:
         self.stop()
         self._stop_event.clear()
         self._last_ocr_text = ""
-        self._text_queue = queue.Queue(maxsize=1)
+        self._start_translation()
+        self._start_input(roi_logical)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._stop_input()
+        for thread in self._translate_threads:
+            thread.join(timeout=1.0)
+        self._translate_threads = []
+        if not self._keep_models:
+            self._models.release()
+
+    def pause(self) -> None:
+        self._input_paused.set()
+
+    def retarget(self, roi_logical) -> None:
+        if not self.running:
+            self.start(roi_logical)
+            return
+        mode = self._config.get("input", {}).get("mode", "ocr")
+        if self._input_stop is None or mode != self._input_mode:
+            self.set_input_mode(mode, roi_logical)
+            return
+        if self._input_mode == "ocr":
+            capture_cfg = self._config["capture"]
+            if self._capture and self._capture_monitor == capture_cfg.get("monitor_index"):
+                self._capture.set_region(self._logical_to_physical_rect(roi_logical))
+            else:
+                previous = self._capture
+                self._capture = self._start_capture(roi_logical)
+                if previous:
+                    previous.stop()
+                if self._capture and self._ocr_thread is None:
+                    self._start_ocr()
+            self._capture_generation += 1
+        self._input_paused.clear()
+
+    def set_input_mode(self, mode: str, roi_logical) -> None:
+        self._config.setdefault("input", {})["mode"] = mode
+        if not self.running:
+            self.start(roi_logical)
+            return
+        self._stop_input()
+        self._flush_pending()
+        self._last_ocr_text = ""
+        self._start_input(roi_logical)
+
+    def _start_translation(self) -> None:
+        batch_cfg = self._config["pipeline"].get("translate_batch", {})
+        self._scheduler = TranslationScheduler(max_pending=int(batch_cfg.get("queue_size", 16)))
+        self._last_emitted_seq = 0
 
         translate_cfg = self._config["translate"]
         self._translate_cfg = translate_cfg
@@ -64,17 +177,46 @@ class PipelineController(QtCore.QObject):
         if self._translator.error:
             self.status.emit(f"Translate init failed: {self._translator.error}")
         else:
-            if isinstance(self._translator, (CT2Translator, CT2CascadeTranslator, CT2NLLBTranslator)):
+            if engine_name(translate_cfg) == "argos":
+                self.status.emit(f"Translator: Argos {self._translator.mode}")
+                direct_error = self._translator.direct_error
+                if direct_error:
+                    self.status.emit(f"Argos direct mode unavailable: {direct_error}")
+            else:
                 self.status.emit(
                     f"Translator: CT2 {self._translator.device}/{self._translator.compute_type}"
                 )
-            else:
-                self.status.emit("Translator: Argos")
 
         cache_cfg = self._config["pipeline"]["cache"]
-        self._cache = LRUCache(max_entries=cache_cfg["max_entries"])
+        if cache_cfg.get("enabled", True):
+            if self._cache is None:
+                self._cache = self._create_cache(cache_cfg)
+            self._cache.set_namespace(self._cache_namespace(translate_cfg))
+        else:
+            self._cache = None
+
+        if self._incremental_cfg.get("enabled", True):
+            self._prefix_tracker = PrefixTracker(
+                rollback_tokens=self._incremental_cfg.get("rollback_tokens", 2),
+                min_prefix_tokens=self._incremental_cfg.get("min_prefix_tokens", 2),
+            )
+        else:
+            self._prefix_tracker = None
+        self._last_preview = ""
 
         sb_cfg = self._config["pipeline"].get("sentence_buffer", {})
+        reveal_cfg = self._config["pipeline"].get("reveal", {})
+        if reveal_cfg.get("enabled", True):
+            self._stabilizer = RevealStabilizer(
+                quiet_ms=reveal_cfg.get("quiet_ms", 300),
+                max_hold_ms=reveal_cfg.get("max_hold_ms", 3000),
+                end_punct=sb_cfg.get("end_punct", ".!?…"),
+                prefix_similarity=reveal_cfg.get("prefix_similarity", 0.9),
+            )
+            self._metrics.set_gauge("translations_saved", 0)
+        else:
+            self._stabilizer = None
+
         if sb_cfg.get("enabled", True):
             self._sentence_buffer = SentenceBuffer(
                 merge_gap_ms=sb_cfg.get("merge_gap_ms", 1200),
@@ -88,6 +230,27 @@ class PipelineController(QtCore.QObject):
         else:
             self._sentence_buffer = None
 
+        if not self._translator.error:
+            debounce_cfg = self._config["pipeline"]["debounce"]
+            min_interval = debounce_cfg["min_translate_interval_ms"] / 1000.0
+            self._translate_bucket = TokenBucket(
+                1.0 / min_interval if min_interval > 0 else 0.0,
+                burst=debounce_cfg.get("translate_burst", 2),
+            )
+            workers = int(batch_cfg.get("workers", 0))
+            if workers <= 0:
+                workers = getattr(self._translator, "inter_threads", 1)
+            self._metrics.set_gauge("translate_workers", workers)
+            for index in range(workers):
+                thread = threading.Thread(
+                    target=self._translate_loop, name=f"translate-{index}", daemon=True
+                )
+                thread.start()
+                self._translate_threads.append(thread)
+
+    def _start_input(self, roi_logical) -> None:
+        self._input_stop = threading.Event()
+        self._input_paused.clear()
         input_cfg = self._config.get("input", {})
         self._input_mode = input_cfg.get("mode", "ocr")
 
@@ -101,7 +264,7 @@ class PipelineController(QtCore.QObject):
             self.status.emit(f"Caption server: http://127.0.0.1:{port}/caption")
 
             self._external_thread = threading.Thread(
-                target=self._external_loop, daemon=True
+                target=self._external_loop, args=(self._input_stop,), daemon=True
             )
             self._external_thread.start()
         elif self._input_mode == "text_hook_clipboard":
@@ -128,38 +291,32 @@ class PipelineController(QtCore.QObject):
             self.status.emit(f"Text hook: clipboard (poll {poll_ms} ms, filter {label})")
 
             self._external_thread = threading.Thread(
-                target=self._external_loop, daemon=True
+                target=self._external_loop, args=(self._input_stop,), daemon=True
             )
             self._external_thread.start()
         else:
-            roi_physical = self._logical_to_physical_rect(roi_logical)
-            capture_cfg = self._config["capture"]
-            self._capture = DXCamCapture(
-                monitor_index=capture_cfg["monitor_index"],
-                target_fps=capture_cfg["target_fps"],
-            )
-            self._capture.start(roi_physical)
-
-            self._ocr_engine = self._create_ocr_engine(self._config["ocr"])
-            if self._ocr_engine.error:
-                self.status.emit(f"OCR init failed: {self._ocr_engine.error}")
+            self._capture = self._start_capture(roi_logical)
+            if self._capture:
+                self._start_ocr()
 
-            ocr_thread = threading.Thread(target=self._ocr_loop, daemon=True)
-            ocr_thread.start()
-            self._threads.append(ocr_thread)
+    def _start_ocr(self) -> None:
+        self._ocr_engine = self._create_ocr_engine(self._config["ocr"])
+        if self._ocr_engine.error:
+            self.status.emit(f"OCR init failed: {self._ocr_engine.error}")
 
-        if not self._translator.error:
-            translate_thread = threading.Thread(target=self._translate_loop, daemon=True)
-            translate_thread.start()
-            self._threads.append(translate_thread)
+        self._ocr_thread = threading.Thread(
+            target=self._ocr_loop, args=(self._input_stop,), daemon=True
+        )
+        self._ocr_thread.start()
 
-    def stop(self) -> None:
-        self._stop_event.set()
-        for thread in self._threads:
-            thread.join(timeout=1.0)
-        self._threads = []
+    def _stop_input(self) -> None:
+        if self._input_stop:
+            self._input_stop.set()
         if self._capture:
             self._capture.stop()
+        if self._ocr_thread:
+            self._ocr_thread.join(timeout=1.0)
+        self._ocr_thread = None
         self._capture = None
         if self._caption_server:
             self._caption_server.stop()
@@ -171,87 +328,202 @@ class PipelineController(QtCore.QObject):
             self._external_thread.join(timeout=1.0)
         self._external_thread = None
         self._external_queue = None
+        self._input_stop = None
         self._text_hook_path = ""
         self._text_hook_require_foreground = True
         self._text_hook_re = None
         self._text_hook_debug = False
         self._text_hook_status_last = ""
 
-    def _ocr_loop(self) -> None:
+    def _start_capture(self, roi_logical):
+        capture_cfg = self._config["capture"]
+        try:
+            capture = self._create_capture(capture_cfg)
+        except Exception as exc:
+            self.status.emit(f"Capture init failed: {exc}")
+            return None
+        capture.start(self._logical_to_physical_rect(roi_logical))
+        self._capture_monitor = capture_cfg.get("monitor_index")
+        return capture
+
+    def _ocr_loop(self, stop_event: threading.Event) -> None:
         if not self._ocr_engine or self._ocr_engine.error:
             return
 
         pipeline_cfg = self._config["pipeline"]
         ocr_interval = pipeline_cfg["ocr_interval_ms"] / 1000.0
+        min_spacing = pipeline_cfg.get("ocr_min_spacing_ms", 30) / 1000.0
         change_cfg = pipeline_cfg["change_detect"]
         debounce_cfg = pipeline_cfg["debounce"]
         sim_threshold = debounce_cfg["text_similarity_threshold"]
 
-        last_small = None
-
-        while not self._stop_event.is_set():
-            time.sleep(ocr_interval)
+        detector = None
+        if change_cfg["enabled"]:
+            detector = TileChangeDetector(
+                tile_size=change_cfg.get("tile_size", 32),
+                samples=change_cfg.get("tile_samples", 4),
+                mad_threshold=change_cfg["mad_threshold"],
+                ignore_regions=change_cfg.get("ignore_regions", []),
+            )
+        crop_ocr = change_cfg["enabled"] and change_cfg.get("crop_ocr", True)
+        box_reuse = isinstance(self._ocr_engine, BoxReuseOCREngine)
+        layout = []
+
+        idle_cfg = pipeline_cfg.get("idle", {})
+        max_interval = idle_cfg.get("max_interval_ms", 1000) / 1000.0
+        if not idle_cfg.get("enabled", True):
+            max_interval = min_spacing
+        pacing = AdaptiveRate(
+            min_spacing,
+            max_interval,
+            backoff=idle_cfg.get("backoff", 1.5),
+            idle_after=idle_cfg.get("after_ms", 3000) / 1000.0,
+        )
+        pacing.reset(time.monotonic())
+        last_seq = 0
+        last_run = 0.0
+        generation = self._capture_generation
+
+        while not stop_event.is_set():
+            if self._input_paused.is_set():
+                stop_event.wait(0.05)
+                continue
+            if generation != self._capture_generation:
+                generation = self._capture_generation
+                if detector:
+                    detector.reset()
+                if hasattr(self._ocr_engine, "reset"):
+                    self._ocr_engine.reset()
+                layout = []
+                last_seq = 0
+                self._last_ocr_text = ""
+                self._flush_pending()
+                pacing.reset(time.monotonic())
+            delay = pacing.interval - (time.monotonic() - last_run)
+            if delay > 0 and stop_event.wait(delay):
+                break
+            capture = self._capture
+            if capture is None:
+                if stop_event.wait(0.05):
+                    break
+                continue
+            seq, frame, grabbed_at = capture.wait_for_frame(
+                last_seq, timeout=max(ocr_interval, pacing.interval)
+            )
             now = time.time()
-            frame = self._capture.get_latest_frame() if self._capture else None
             if frame is None:
-                if self._sentence_buffer:
-                    for sentence in self._sentence_buffer.flush_if_timeout(now):
-                        self._push_latest_text(sentence)
+                self._mark_unchanged(pacing)
+                self._flush_sentences(now)
                 continue
-
-            gray = self._to_gray(frame)
-            if change_cfg["enabled"]:
-                small = cv2.resize(
-                    gray,
-                    (change_cfg["downsample"], change_cfg["downsample"]),
-                    interpolation=cv2.INTER_AREA,
-                )
-                if last_small is not None:
-                    mad = np.mean(cv2.absdiff(small, last_small))
-                    if mad < change_cfg["mad_threshold"]:
-                        last_small = small
-                        continue
-                last_small = small
+            last_seq = seq
+            last_run = time.monotonic()
+
+            trace = self._metrics.trace(grabbed_at or None)
+            trace.mark("capture")
+            self._metrics.incr("frames")
+            region = None
+            if detector:
+                gray = self._to_gray(frame)
+                _tiles, region = detector.update(gray)
+                trace.mark("change_detect")
+                if region is None:
+                    self._metrics.incr("frames_unchanged")
+                    self._mark_unchanged(pacing)
+                    self._flush_sentences(now)
+                    continue
+            self._mark_changed(pacing)
 
             bgr = self._to_bgr(frame)
-            raw_text, error = self._ocr_engine.recognize_text(bgr)
+            if crop_ocr and box_reuse:
+                layout, error = self._recognize_dirty_boxes(bgr, region, change_cfg)
+            elif crop_ocr:
+                layout, error = self._recognize_changed(bgr, region, layout, change_cfg)
+            else:
+                layout, error = self._ocr_engine.recognize_lines(bgr)
+            trace.mark("recognize_text")
+            self._metrics.incr("ocr_runs")
             if error:
                 self.status.emit(f"OCR error: {error}")
                 continue
+            raw_text = ocr_result_to_text(layout)
 
             normalized = normalize_text(raw_text)
+            trace.mark("normalize_text")
             if not normalized:
-                if self._sentence_buffer:
-                    for sentence in self._sentence_buffer.flush_if_timeout(now):
-                        self._push_latest_text(sentence)
+                self._flush_sentences(now)
                 continue
 
-            if similarity(normalized, self._last_ocr_text) >= sim_threshold:
-                if self._sentence_buffer:
-                    for sentence in self._sentence_buffer.flush_if_timeout(now):
-                        self._push_latest_text(sentence)
+            if similarity_at_least(normalized, self._last_ocr_text, sim_threshold):
+                self._metrics.incr("ocr_debounced")
+                self._flush_sentences(now)
                 continue
 
             self._last_ocr_text = normalized
             self.ocr_ready.emit(normalized)
-            if self._sentence_buffer:
-                for sentence in self._sentence_buffer.update(normalized, now):
-                    self._push_latest_text(sentence)
-            else:
-                self._push_latest_text(normalized)
+            self._feed_text(normalized, now, trace)
+
+    def _mark_unchanged(self, pacing: AdaptiveRate) -> None:
+        if pacing.unchanged(time.monotonic()):
+            self._metrics.incr("idle_entered")
+        self._update_pacing(pacing)
+
+    def _mark_changed(self, pacing: AdaptiveRate) -> None:
+        if pacing.changed(time.monotonic()):
+            self._metrics.incr("idle_resumed")
+        self._update_pacing(pacing)
+
+    def _update_pacing(self, pacing: AdaptiveRate) -> None:
+        capture = self._capture
+        if capture:
+            capture.throttle(pacing.interval if pacing.idle else 0.0)
+        self._metrics.set_gauge("ocr_rate_hz", round(pacing.rate_hz, 2))
+        self._metrics.set_gauge("idle", pacing.idle)
+
+    def _recognize_dirty_boxes(self, bgr, region, change_cfg: dict):
+        height, width = bgr.shape[:2]
+        padding = int(change_cfg.get("crop_padding", 8))
+        left, top, right, bottom = region
+        dirty = (
+            max(0, left - padding),
+            max(0, top - padding),
+            min(width, right + padding),
+            min(height, bottom + padding),
+        )
+        return self._ocr_engine.recognize_lines(bgr, dirty=dirty)
 
-    def _external_loop(self) -> None:
-        while not self._stop_event.is_set():
+    def _recognize_changed(self, bgr, region, layout, change_cfg: dict):
+        height, width = bgr.shape[:2]
+        if layout and region is not None:
+            left, top, right, bottom = expand_region(
+                region, layout, width, height, padding=int(change_cfg.get("crop_padding", 8))
+            )
+            area = (right - left) * (bottom - top)
+            if area < float(change_cfg.get("crop_max_fraction", 0.6)) * width * height:
+                crop = np.ascontiguousarray(bgr[top:bottom, left:right])
+                lines, error = self._ocr_engine.recognize_lines(crop)
+                if error:
+                    return layout, error
+                self._metrics.incr("ocr_cropped")
+                fresh = offset_result(lines, left, top)
+                return merge_layout(layout, fresh, (left, top, right, bottom)), None
+
+        lines, error = self._ocr_engine.recognize_lines(bgr)
+        if error:
+            return layout, error
+        return lines, None
+
+    def _external_loop(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
             try:
                 text = self._external_queue.get(timeout=0.2)
                 now = time.time()
             except queue.Empty:
-                if self._sentence_buffer:
-                    for sentence in self._sentence_buffer.flush_if_timeout(time.time()):
-                        self._push_latest_text(sentence)
+                self._flush_sentences(time.time())
                 continue
 
+            trace = self._metrics.trace()
             normalized = normalize_text(text)
+            trace.mark("normalize_text")
             if not normalized:
                 continue
 
@@ -262,11 +534,57 @@ class PipelineController(QtCore.QObject):
 
             self._last_ocr_text = normalized
             self.ocr_ready.emit(normalized)
-            if self._sentence_buffer:
-                for sentence in self._sentence_buffer.update(normalized, now):
-                    self._push_latest_text(sentence)
-            else:
-                self._push_latest_text(normalized)
+            self._feed_text(normalized, now, trace)
+
+    def _feed_text(self, text: str, now: float, trace) -> None:
+        if not self._stabilizer:
+            self._feed_stable(text, now, trace)
+            return
+        released = self._stabilizer.update(text, now)
+        trace.mark("stabilize")
+        self._metrics.set_gauge("translations_saved", self._stabilizer.saved)
+        for stable in released:
+            self._feed_stable(stable, now, trace)
+
+    def _feed_stable(self, text: str, now: float, trace) -> None:
+        if not self._sentence_buffer:
+            self._push_latest_text(text, trace, complete=False)
+            return
+        sentences = self._sentence_buffer.update(text, now)
+        trace.mark("sentence_buffer")
+        for sentence in sentences:
+            self._push_latest_text(sentence, trace)
+        self._push_preview(trace)
+
+    def _push_preview(self, trace) -> None:
+        if not self._prefix_tracker or not self._incremental_cfg.get("preview_partials", True):
+            return
+        pending = self._sentence_buffer.pending
+        if not pending:
+            self._last_preview = ""
+            return
+        if pending == self._last_preview:
+            return
+        self._last_preview = pending
+        self._push_latest_text(pending, trace, complete=False)
+
+    def _flush_sentences(self, now: float) -> None:
+        if self._stabilizer:
+            for stable in self._stabilizer.flush_if_quiet(now):
+                self._feed_stable(stable, now, self._metrics.trace())
+        if not self._sentence_buffer:
+            return
+        for sentence in self._sentence_buffer.flush_if_timeout(now):
+            self._push_latest_text(sentence, self._metrics.trace())
+
+    def _flush_pending(self) -> None:
+        if self._stabilizer:
+            for stable in self._stabilizer.flush():
+                self._feed_stable(stable, time.time(), self._metrics.trace())
+        if not self._sentence_buffer:
+            return
+        for sentence in self._sentence_buffer.flush():
+            self._push_latest_text(sentence, self._metrics.trace())
 
     def _text_hook_allows(self, text: str) -> bool:
         if self._text_hook_re and not self._text_hook_re.search(text):
@@ -292,57 +610,185 @@ class PipelineController(QtCore.QObject):
         self.status.emit(message)
 
     def _translate_loop(self) -> None:
-        min_interval = self._config["pipeline"]["debounce"]["min_translate_interval_ms"] / 1000.0
-        last_time = 0.0
+        batch_cfg = self._config["pipeline"].get("translate_batch", {})
+        max_items = max(1, int(batch_cfg.get("max_items", 8)))
+        window = batch_cfg.get("window_ms", 30) / 1000.0
 
         while not self._stop_event.is_set():
-            try:
-                text = self._text_queue.get(timeout=0.2)
-            except queue.Empty:
+            tickets = self._scheduler.take(max_items, window, timeout=0.2)
+            if not tickets:
                 continue
-
-            now = time.time()
-            elapsed = now - last_time
-            if elapsed < min_interval:
-                time.sleep(min_interval - elapsed)
-
-            cached = self._cache.get(text) if self._cache else None
-            if cached:
-                self.translation_ready.emit(cached)
-                last_time = time.time()
+            self._metrics.set_gauge("translate_queue_depth", len(self._scheduler))
+            pending = []
+            deferred = []
+            for ticket in tickets:
+                ticket.trace.mark("queue_wait")
+                if ticket.stale:
+                    self._metrics.incr("texts_superseded")
+                    continue
+                cached = self._cache.get(ticket.text) if self._cache else None
+                ticket.trace.mark("cache_lookup")
+                if not cached:
+                    pending.append(ticket)
+                    continue
+                self._metrics.incr("cache_hits")
+                if pending:
+                    deferred.append((ticket, cached))
+                else:
+                    self._emit_translation(ticket, cached, fresh=False)
+
+            live = self._rate_limit(pending)
+            if live is None:
+                break
+            if len(live) < len(pending):
+                self._metrics.incr("texts_superseded", len(pending) - len(live))
+            if live:
+                self._translate_tickets(live)
+            for ticket, cached in deferred:
+                self._emit_translation(ticket, cached, fresh=False)
+            self._scheduler.done(tickets)
+
+    def _rate_limit(self, pending: list):
+        if not pending:
+            return []
+        bucket = self._translate_bucket
+        limited = False
+        while True:
+            delay = bucket.delay()
+            if delay > 0:
+                limited = True
+                if self._stop_event.wait(delay):
+                    return None
                 continue
-
-            translation, error = self._translator.translate(text)
+            live = [ticket for ticket in pending if not ticket.stale]
+            if not live or bucket.consume():
+                break
+        if limited:
+            for ticket in pending:
+                ticket.trace.mark("rate_limit")
+            self._metrics.incr("rate_limited")
+        return live
+
+    def _translate_tickets(self, tickets: list) -> None:
+        texts = list(dict.fromkeys(ticket.text for ticket in tickets))
+        timings = {}
+        streaming = self._stream_cfg.get("enabled", True)
+        if (
+            len(texts) == 1
+            and (streaming or self._prefix_tracker)
+            and hasattr(self._translator, "translate_tokens")
+        ):
+            translations, error = self._stream_translation(
+                texts[0], tickets, timings, streaming
+            )
+            if translations is None and error is None:
+                self._metrics.incr("translations_aborted")
+                return
+        else:
+            translations, error = self._translator.translate_many(texts, timings=timings)
+        if error:
+            if self._maybe_fallback_translator(error):
+                self._models.put("translate", self._translate_cfg, self._translator)
+                timings = {}
+                translations, error = self._translator.translate_many(texts, timings=timings)
             if error:
-                if self._maybe_fallback_translator(error):
-                    translation, error = self._translator.translate(text)
-                if error:
-                    self.status.emit(f"Translate error: {error}")
-                    continue
-            if self._cache:
-                self._cache.set(text, translation)
+                self.status.emit(f"Translate error: {error}")
+                self._metrics.incr("translate_errors")
+                return
+
+        results = dict(zip(texts, translations))
+        self._metrics.incr("translations", len(translations))
+        self._metrics.incr("translate_batches")
+        if self._cache:
+            for text in dict.fromkeys(t.text for t in tickets if not self._is_preview(t)):
+                self._cache.set(text, results[text])
+        emitted = set()
+        for ticket in sorted(tickets, key=lambda t: t.seq):
+            for stage in ("tokenize", "decode", "detokenize"):
+                if stage in timings:
+                    ticket.trace.add(stage, timings[stage])
+            if ticket.stale:
+                self._metrics.incr("translations_stale")
+                continue
+            fresh = ticket.text not in emitted and not self._is_preview(ticket)
+            self._emit_translation(ticket, results[ticket.text], fresh=fresh)
+            emitted.add(ticket.text)
+
+    def _is_preview(self, ticket) -> bool:
+        return not ticket.complete and self._sentence_buffer is not None
+
+    def _stream_translation(self, text: str, tickets: list, timings: dict, streaming: bool):
+        min_gap = self._stream_cfg.get("min_emit_interval_ms", 60) / 1000.0
+        last_emit = 0.0
+
+        def on_partial(partial: str) -> None:
+            nonlocal last_emit
+            now = time.monotonic()
+            if not partial or now - last_emit < min_gap or all(t.stale for t in tickets):
+                return
+            last_emit = now
+            with self._emit_lock:
+                newest = max(t.seq for t in tickets)
+                if newest < self._last_emitted_seq:
+                    return
+                self._last_emitted_seq = newest
+                self.translation_ready.emit(partial)
+            self._metrics.incr("partial_emits")
+
+        prefix = self._prefix_tracker.prefix_for(text) if self._prefix_tracker else None
+        if prefix:
+            self._metrics.incr("prefix_reuses")
+        tokens, error = self._translator.translate_tokens(
+            text,
+            target_prefix=prefix,
+            on_partial=on_partial if streaming else None,
+            should_stop=lambda: self._stop_event.is_set() or all(t.stale for t in tickets),
+            timings=timings,
+            emit_every=int(self._stream_cfg.get("emit_every_tokens", 4)),
+        )
+        if tokens is None:
+            return None, error
+        if self._prefix_tracker:
+            self._prefix_tracker.update(text, tokens)
+        started = time.perf_counter()
+        translation = self._translator.detokenize(tokens)
+        timings["detokenize"] = timings.get("detokenize", 0.0) + time.perf_counter() - started
+        return [translation], None
+
+    def _emit_translation(self, ticket, translation: str, fresh: bool) -> None:
+        with self._emit_lock:
+            if ticket.seq < self._last_emitted_seq:
+                self._metrics.incr("translations_out_of_order")
+                return
+            self._last_emitted_seq = ticket.seq
             self.translation_ready.emit(translation)
-            self.translation_pair.emit(text, translation)
-            last_time = time.time()
-
-    def _push_latest_text(self, text: str) -> None:
-        try:
-            _ = self._text_queue.get_nowait()
-        except queue.Empty:
-            pass
-        try:
-            self._text_queue.put_nowait(text)
-        except queue.Full:
-            pass
+            if fresh:
+                self.translation_pair.emit(ticket.text, translation)
+        if startup.mark("first_translation"):
+            self.status.emit(f"Startup: {startup.summary()}")
+        ticket.trace.mark("signal_emit")
+        ticket.trace.finish()
+
+    def _push_latest_text(self, text: str, trace, complete: bool = True) -> None:
+        trace = trace.copy()
+        trace.mark("enqueue")
+        self._metrics.incr("texts_queued")
+        superseded, dropped = self._scheduler.submit(text, trace, complete=complete)
+        if superseded:
+            self._metrics.incr("texts_superseded", len(superseded))
+        if dropped:
+            self._metrics.incr("texts_dropped", len(dropped))
 
     def _to_gray(self, frame):
+        gray = self._buffers.get("gray", frame.shape[:2])
         if frame.ndim == 3 and frame.shape[2] == 4:
-            return cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            return cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY, dst=gray)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
 
     def _to_bgr(self, frame):
         if frame.ndim == 3 and frame.shape[2] == 4:
-            return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+            bgr = self._buffers.get("bgr", frame.shape[:2] + (3,))
+            return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR, dst=bgr)
         return frame
 
     def _logical_to_physical_rect(self, rect):
@@ -364,7 +810,7 @@ class PipelineController(QtCore.QObject):
         )
 
     def _on_external_text(self, text: str) -> None:
-        if not self._external_queue:
+        if not self._external_queue or self._input_paused.is_set():
             return
         if self._text_hook_debug and text:
             self._emit_text_hook_status(f"Text hook received {len(text)} chars")
@@ -380,164 +826,188 @@ class PipelineController(QtCore.QObject):
             except queue.Full:
                 pass
 
-    def _create_ocr_engine(self, ocr_cfg: dict):
-        engine_name = ocr_cfg.get("engine", "rapidocr_onnxruntime")
-        if engine_name == "paddleocr":
-            paddle_cfg = ocr_cfg.get("paddle", {})
-            return PaddleOCREngine(
-                det_model_dir=paddle_cfg.get("det_model_dir", ""),
-                rec_model_dir=paddle_cfg.get("rec_model_dir", ""),
-                device=paddle_cfg.get("device", "cpu"),
+    def get_metrics(self) -> dict:
+        data = self._metrics.snapshot()
+        data.update(self._component_stats())
+        return data
+
+    def dump_metrics(self, path) -> None:
+        self._metrics.dump_json(path, extra=self._component_stats())
+
+    def _component_stats(self) -> dict:
+        stats = {
+            "cache": self.cache_stats(),
+            "models": self._models.stats(),
+            "startup": startup.report(),
+        }
+        if hasattr(self._ocr_engine, "stats"):
+            stats["ocr"] = self._ocr_engine.stats()
+        if hasattr(self._translator, "tokenizer_stats"):
+            stats["tokenizer"] = self._translator.tokenizer_stats()
+        return stats
+
+    def reset_metrics(self) -> None:
+        self._metrics.reset()
+
+    @property
+    def capture_finished(self) -> bool:
+        return bool(getattr(self._capture, "finished", False))
+
+    def cache_stats(self) -> dict:
+        if not self._cache:
+            return {}
+        return self._cache.stats()
+
+    def _create_cache(self, cache_cfg: dict) -> TranslationCache:
+        memory = LRUCache(max_entries=cache_cfg["max_entries"])
+        store = None
+        persistent_cfg = cache_cfg.get("persistent", {})
+        if persistent_cfg.get("enabled", True):
+            path = resolve_path(persistent_cfg.get("path", "cache/translations.sqlite3"))
+            max_bytes = int(float(persistent_cfg.get("max_mb", 64)) * 1024 * 1024)
+            try:
+                store = PersistentCache(path, max_bytes=max_bytes)
+            except Exception as exc:
+                self.status.emit(f"Translation cache unavailable: {exc}")
+        fuzzy = None
+        fuzzy_cfg = cache_cfg.get("fuzzy", {})
+        if fuzzy_cfg.get("enabled", True):
+            fuzzy = FuzzyIndex(
+                min_similarity=float(fuzzy_cfg.get("similarity", 0.9)),
+                ngram=int(fuzzy_cfg.get("ngram", 2)),
+                latin_ngram=int(fuzzy_cfg.get("latin_ngram", 4)),
+                max_entries=int(fuzzy_cfg.get("max_entries", 50000)),
+                min_chars=int(fuzzy_cfg.get("min_chars", 8)),
             )
+        return TranslationCache(memory, store, fuzzy)
 
-        return RapidOCREngine(
-            det_model_path=ocr_cfg["det_model_path"],
-            rec_model_path=ocr_cfg["rec_model_path"],
-            box_thresh=ocr_cfg["box_thresh"],
-            unclip_ratio=ocr_cfg["unclip_ratio"],
-            text_score=ocr_cfg["text_score"],
-        )
-
-    def _create_translator(self, translate_cfg: dict):
+    def _cache_namespace(self, translate_cfg: dict) -> str:
         engine_name = translate_cfg.get("engine", "argos")
         if engine_name == "ct2_nllb":
-            nllb_cfg = translate_cfg.get("ct2_nllb", {})
             lang_cfg = translate_cfg.get("nllb", {})
-            translator = CT2NLLBTranslator(
-                model_dir=nllb_cfg.get("model_dir", ""),
-                tokenizer_dir=nllb_cfg.get("tokenizer_dir"),
-                source_lang=lang_cfg.get("source_lang", "jpn_Jpan"),
-                target_lang=lang_cfg.get("target_lang", "zho_Hans"),
-                device=nllb_cfg.get("device", "cpu"),
-                compute_type=nllb_cfg.get("compute_type", "float32"),
-                beam_size=nllb_cfg.get("beam_size", 1),
-                max_batch_size=nllb_cfg.get("max_batch_size", 1),
-            )
-            if translator.error and nllb_cfg.get("device", "cpu") in ("cuda", "gpu"):
-                self.status.emit(
-                    "CT2 NLLB GPU init failed; falling back to CPU (int8)."
-                )
-                return CT2NLLBTranslator(
-                    model_dir=nllb_cfg.get("model_dir", ""),
-                    tokenizer_dir=nllb_cfg.get("tokenizer_dir"),
-                    source_lang=lang_cfg.get("source_lang", "jpn_Jpan"),
-                    target_lang=lang_cfg.get("target_lang", "zho_Hans"),
-                    device="cpu",
-                    compute_type="int8",
-                    beam_size=nllb_cfg.get("beam_size", 1),
-                    max_batch_size=nllb_cfg.get("max_batch_size", 1),
+            model = translate_cfg.get("ct2_nllb", {}).get("model_dir", "")
+            pair = f"{lang_cfg.get('source_lang', 'jpn_Jpan')}>{lang_cfg.get('target_lang', 'zho_Hans')}"
+        else:
+            if engine_name == "ct2_cascade":
+                cascade_cfg = translate_cfg.get("ct2_cascade", {})
+                model = "+".join(
+                    [cascade_cfg.get("first_model_dir", ""), cascade_cfg.get("second_model_dir", "")]
                 )
-            return translator
-
-        if engine_name == "ct2_cascade":
-            cascade_cfg = translate_cfg.get("ct2_cascade", {})
-            translator = CT2CascadeTranslator(
-                first_model_dir=cascade_cfg.get("first_model_dir", ""),
-                second_model_dir=cascade_cfg.get("second_model_dir", ""),
-                first_tokenizer_dir=cascade_cfg.get("first_tokenizer_dir"),
-                second_tokenizer_dir=cascade_cfg.get("second_tokenizer_dir"),
-                device=cascade_cfg.get("device", "cpu"),
-                compute_type=cascade_cfg.get("compute_type", "float32"),
-                beam_size=cascade_cfg.get("beam_size", 1),
-                max_batch_size=cascade_cfg.get("max_batch_size", 1),
+            elif engine_name == "ct2":
+                model = translate_cfg.get("ct2", {}).get("model_dir", "")
+            else:
+                model = ""
+            pair = f"{translate_cfg.get('from', 'en')}>{translate_cfg.get('to', 'zh')}"
+        return f"{engine_name}|{model}|{pair}"
+
+    def _create_capture(self, capture_cfg: dict):
+        backend = capture_cfg.get("backend", "dxcam")
+        if backend == "replay":
+            replay_cfg = capture_cfg.get("replay", {})
+            capture = ReplayCapture(
+                path=replay_cfg.get("path", ""),
+                realtime=replay_cfg.get("realtime", True),
+                speed=replay_cfg.get("speed", 1.0),
+                loop=replay_cfg.get("loop", False),
             )
-            if translator.error and cascade_cfg.get("device", "cpu") in ("cuda", "gpu"):
-                self.status.emit(
-                    "CT2 cascade GPU init failed; falling back to CPU (int8)."
-                )
-                return CT2CascadeTranslator(
-                    first_model_dir=cascade_cfg.get("first_model_dir", ""),
-                    second_model_dir=cascade_cfg.get("second_model_dir", ""),
-                    first_tokenizer_dir=cascade_cfg.get("first_tokenizer_dir"),
-                    second_tokenizer_dir=cascade_cfg.get("second_tokenizer_dir"),
-                    device="cpu",
-                    compute_type="int8",
-                    beam_size=cascade_cfg.get("beam_size", 1),
-                    max_batch_size=cascade_cfg.get("max_batch_size", 1),
-                )
-            return translator
-
-        if engine_name == "ct2":
-            ct2_cfg = translate_cfg.get("ct2", {})
-            translator = CT2Translator(
-                model_dir=ct2_cfg.get("model_dir", ""),
-                tokenizer_dir=ct2_cfg.get("tokenizer_dir"),
-                device=ct2_cfg.get("device", "cpu"),
-                compute_type=ct2_cfg.get("compute_type", "float32"),
-                beam_size=ct2_cfg.get("beam_size", 1),
-                max_batch_size=ct2_cfg.get("max_batch_size", 1),
+            self.status.emit(f"Capture: replay {capture.recording.path}")
+            return capture
+
+        from capture.dxcam_backend import DXCamCapture
+
+        recorder = None
+        record_cfg = capture_cfg.get("record", {})
+        if record_cfg.get("enabled", False):
+            record_dir = resolve_path(record_cfg.get("path", "recordings"))
+            recorder = FrameRecorder(
+                record_dir / time.strftime("%Y%m%d-%H%M%S"),
+                max_fps=record_cfg.get("fps", 10),
+                on_segment=lambda path, old, new: self.status.emit(
+                    f"Capture size changed {old} -> {new}; recording to {path}"
+                ),
             )
-            if translator.error and ct2_cfg.get("device", "cpu") in ("cuda", "gpu"):
-                self.status.emit(
-                    "CT2 GPU init failed; falling back to CPU (int8)."
-                )
-                return CT2Translator(
-                    model_dir=ct2_cfg.get("model_dir", ""),
-                    tokenizer_dir=ct2_cfg.get("tokenizer_dir"),
-                    device="cpu",
-                    compute_type="int8",
-                    beam_size=ct2_cfg.get("beam_size", 1),
-                    max_batch_size=ct2_cfg.get("max_batch_size", 1),
+            self.status.emit(f"Recording frames to {recorder.path}")
+        return DXCamCapture(
+            monitor_index=capture_cfg["monitor_index"],
+            target_fps=capture_cfg["target_fps"],
+            recorder=recorder,
+        )
+
+    def _create_ocr_engine(self, ocr_cfg: dict):
+        reuse_cfg = ocr_cfg.get("box_reuse", {})
+        reuse_boxes = reuse_cfg.get("enabled", True)
+        engine = self._ocr_model(ocr_cfg)
+
+        if reuse_boxes and not engine.error:
+            line_cache = None
+            line_cfg = ocr_cfg.get("line_cache", {})
+            if line_cfg.get("enabled", True):
+                line_cache = LineRecognitionCache(
+                    max_entries=line_cfg.get("max_entries", 2048),
+                    hash_height=line_cfg.get("hash_height", 24),
                 )
-            return translator
+            return BoxReuseOCREngine(
+                engine,
+                redetect_interval_ms=reuse_cfg.get("redetect_interval_ms", 3000),
+                min_score=reuse_cfg.get("min_score", ocr_cfg.get("text_score", 0.5)),
+                layout_diff_threshold=reuse_cfg.get("layout_diff_threshold", 24.0),
+                layout_changed_pixels=reuse_cfg.get("layout_changed_pixels", 2),
+                line_cache=line_cache,
+            )
+        return engine
+
+    def _ocr_model(self, ocr_cfg: dict):
+        modular = ocr_cfg.get("box_reuse", {}).get("enabled", True)
+        model_cfg = {key: value for key, value in ocr_cfg.items() if key not in ("box_reuse", "line_cache")}
+        model_cfg["modular"] = modular
+        return self._models.get("ocr", model_cfg, lambda: self._load_ocr_engine(ocr_cfg, modular))
+
+    def _load_ocr_engine(self, ocr_cfg: dict, modular: bool):
+        process_cfg = ocr_cfg.get("process", {})
+        if process_cfg.get("enabled", False):
+            started = time.perf_counter()
+            engine = ProcessOCREngine(
+                {key: value for key, value in ocr_cfg.items() if key != "process"},
+                modular=modular,
+                warmup=self._warmup_models,
+                timeout_ms=process_cfg.get("timeout_ms", 5000),
+                start_timeout_ms=process_cfg.get("start_timeout_ms", 120000),
+                max_restarts=process_cfg.get("max_restarts", 5),
+                retry_ms=process_cfg.get("retry_ms", 30000),
+            )
+            self._metrics.record("ocr_process_start", time.perf_counter() - started)
+            return engine
+        engine = create_ocr_engine(ocr_cfg, modular=modular)
+        if self._warmup_models:
+            started = time.perf_counter()
+            warmup_ocr_engine(engine)
+            self._metrics.record("ocr_warmup", time.perf_counter() - started)
+        return engine
 
-        return ArgosTranslator(
-            from_code=translate_cfg.get("from", "en"),
-            to_code=translate_cfg.get("to", "zh"),
-            device_type=translate_cfg.get("argos_device_type", "cpu"),
-        )
+    def _create_translator(self, translate_cfg: dict):
+        return self._models.get("translate", translate_cfg, lambda: self._load_translator(translate_cfg))
+
+    def _load_translator(self, translate_cfg: dict):
+        translator = create_translator(translate_cfg)
+        if translator.error and uses_gpu(translator):
+            label = ENGINE_LABELS[engine_name(translate_cfg)]
+            self.status.emit(f"{label} GPU init failed; falling back to CPU (int8).")
+            translator = create_translator(translate_cfg, cpu_fallback=True)
+        if self._warmup_models:
+            started = time.perf_counter()
+            warmup_translator(translator)
+            self._metrics.record("translate_warmup", time.perf_counter() - started)
+        return translator
 
     def _maybe_fallback_translator(self, error: str) -> bool:
-        if not isinstance(self._translator, (CT2Translator, CT2CascadeTranslator, CT2NLLBTranslator)):
-            return False
-        if not self._translate_cfg:
-            return False
-        if self._translator.device not in ("cuda", "gpu"):
+        if not self._translate_cfg or not uses_gpu(self._translator):
             return False
 
         err_lower = error.lower()
         if "cublas64_12" not in err_lower and "cuda" not in err_lower and "cudnn" not in err_lower:
             return False
 
-        if isinstance(self._translator, CT2Translator):
-            ct2_cfg = self._translate_cfg.get("ct2", {})
-            self.status.emit("CT2 GPU runtime missing; switching to CPU int8.")
-            self._translator = CT2Translator(
-                model_dir=ct2_cfg.get("model_dir", ""),
-                tokenizer_dir=ct2_cfg.get("tokenizer_dir"),
-                device="cpu",
-                compute_type="int8",
-                beam_size=ct2_cfg.get("beam_size", 1),
-                max_batch_size=ct2_cfg.get("max_batch_size", 1),
-            )
-            return self._translator.error is None
-
-        if isinstance(self._translator, CT2CascadeTranslator):
-            cascade_cfg = self._translate_cfg.get("ct2_cascade", {})
-            self.status.emit("CT2 cascade GPU runtime missing; switching to CPU int8.")
-            self._translator = CT2CascadeTranslator(
-                first_model_dir=cascade_cfg.get("first_model_dir", ""),
-                second_model_dir=cascade_cfg.get("second_model_dir", ""),
-                first_tokenizer_dir=cascade_cfg.get("first_tokenizer_dir"),
-                second_tokenizer_dir=cascade_cfg.get("second_tokenizer_dir"),
-                device="cpu",
-                compute_type="int8",
-                beam_size=cascade_cfg.get("beam_size", 1),
-                max_batch_size=cascade_cfg.get("max_batch_size", 1),
-            )
-            return self._translator.error is None
-
-        nllb_cfg = self._translate_cfg.get("ct2_nllb", {})
-        lang_cfg = self._translate_cfg.get("nllb", {})
-        self.status.emit("CT2 NLLB GPU runtime missing; switching to CPU int8.")
-        self._translator = CT2NLLBTranslator(
-            model_dir=nllb_cfg.get("model_dir", ""),
-            tokenizer_dir=nllb_cfg.get("tokenizer_dir"),
-            source_lang=lang_cfg.get("source_lang", "jpn_Jpan"),
-            target_lang=lang_cfg.get("target_lang", "zho_Hans"),
-            device="cpu",
-            compute_type="int8",
-            beam_size=nllb_cfg.get("beam_size", 1),
-            max_batch_size=nllb_cfg.get("max_batch_size", 1),
-        )
+        label = ENGINE_LABELS[engine_name(self._translate_cfg)]
+        self.status.emit(f"{label} GPU runtime missing; switching to CPU int8.")
+        self._translator = create_translator(self._translate_cfg, cpu_fallback=True)
         return self._translator.error is None
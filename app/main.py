@@ -2,12 +2,14 @@ import os
 import sys
 from pathlib import Path
 
-from PySide6 import QtCore, QtGui, QtWidgets
-
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from utils import startup
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
 from app.controller import PipelineController
 from ui.control_window import ControlWindow
 from ui.context_window import ContextWindow
@@ -23,6 +25,8 @@ def main() -> int:
 
     app = QtWidgets.QApplication(sys.argv)
     config = load_config()
+    if "--record" in sys.argv:
+        config["capture"].setdefault("record", {})["enabled"] = True
 
     controller = PipelineController(config)
     overlay = OverlayWindow(config)
@@ -33,7 +37,7 @@ def main() -> int:
     input_mode = config.get("input", {}).get("mode", "ocr")
     control.set_mode(input_mode)
 
-    def on_roi_selected(roi_logical):
+    def show_for_roi(roi_logical):
         config["capture"]["roi"] = list(roi_logical)
         left, top, _right, _bottom = roi_logical
         screen = QtGui.QGuiApplication.screenAt(QtCore.QPoint(left, top))
@@ -60,10 +64,13 @@ def main() -> int:
         if context:
             context.position_for_roi(roi_logical)
             context.show()
-        controller.start(roi_logical)
+
+    def on_roi_selected(roi_logical):
+        show_for_roi(roi_logical)
+        controller.retarget(roi_logical)
 
     def on_reselect():
-        controller.stop()
+        controller.pause()
         overlay.hide()
         control.hide()
         if context:
@@ -87,10 +94,12 @@ def main() -> int:
         input_mode = mode
         config.setdefault("input", {})["mode"] = mode
         save_user_config({"input": {"mode": mode}})
-        controller.stop()
         if config.get("capture", {}).get("roi"):
-            on_roi_selected(tuple(config["capture"]["roi"]))
+            roi_logical = tuple(config["capture"]["roi"])
+            show_for_roi(roi_logical)
+            controller.set_input_mode(mode, roi_logical)
         else:
+            controller.pause()
             selection.activate()
 
     selection.roi_selected.connect(on_roi_selected)
@@ -105,11 +114,17 @@ def main() -> int:
     controller.status.connect(overlay.update_status)
     app.aboutToQuit.connect(controller.stop)
 
+    def on_first_window():
+        startup.mark("first_window")
+        if config["pipeline"].get("models", {}).get("preload", True):
+            controller.preload()
+
     use_last = "--use-last" in sys.argv
     if use_last and config.get("capture", {}).get("roi"):
         on_roi_selected(tuple(config["capture"]["roi"]))
     else:
         selection.activate()
+    QtCore.QTimer.singleShot(0, on_first_window)
 
     return app.exec()
 
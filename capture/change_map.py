@@ -0,0 +1,76 @@
+import math
+
+import cv2
+import numpy as np
+
+from utils.buffer_pool import BufferPool
+
+
+class TileChangeDetector:
+    def __init__(
+        self,
+        tile_size: int = 32,
+        samples: int = 4,
+        mad_threshold: float = 3.0,
+        ignore_regions=(),
+    ) -> None:
+        self._tile_size = max(4, int(tile_size))
+        self._samples = max(1, int(samples))
+        self._mad_threshold = mad_threshold
+        self._ignore_regions = [tuple(region) for region in ignore_regions]
+        self._last_small = None
+        self._grid = None
+        self._ignore_mask = None
+        self._pool = BufferPool()
+        self._active = 0
+
+    def reset(self) -> None:
+        self._last_small = None
+        self._grid = None
+        self._ignore_mask = None
+
+    def update(self, gray):
+        height, width = gray.shape[:2]
+        rows = max(1, math.ceil(height / self._tile_size))
+        cols = max(1, math.ceil(width / self._tile_size))
+        small_shape = (rows * self._samples, cols * self._samples)
+        small = self._pool.get(f"small{self._active}", small_shape)
+        cv2.resize(gray, (small_shape[1], small_shape[0]), dst=small, interpolation=cv2.INTER_AREA)
+        self._active ^= 1
+
+        if self._grid != (height, width, rows, cols) or self._last_small is None:
+            self._grid = (height, width, rows, cols)
+            self._ignore_mask = self._build_ignore_mask(rows, cols)
+            self._last_small = small
+            tiles = ~self._ignore_mask
+            return tiles, (0, 0, width, height)
+
+        diff = cv2.absdiff(small, self._last_small, dst=self._pool.get("diff", small_shape))
+        self._last_small = small
+        tile_mad = diff.reshape(rows, self._samples, cols, self._samples).mean(axis=(1, 3))
+        tiles = (tile_mad >= self._mad_threshold) & ~self._ignore_mask
+        return tiles, self._tiles_to_bbox(tiles, width, height)
+
+    def _tiles_to_bbox(self, tiles, width: int, height: int):
+        ys, xs = np.nonzero(tiles)
+        if len(ys) == 0:
+            return None
+        rows, cols = tiles.shape
+        return (
+            int(xs.min()) * width // cols,
+            int(ys.min()) * height // rows,
+            (int(xs.max()) + 1) * width // cols,
+            (int(ys.max()) + 1) * height // rows,
+        )
+
+    def _build_ignore_mask(self, rows: int, cols: int):
+        mask = np.zeros((rows, cols), dtype=bool)
+        if not self._ignore_regions:
+            return mask
+        centers_x = (np.arange(cols) + 0.5) / cols
+        centers_y = (np.arange(rows) + 0.5) / rows
+        for left, top, right, bottom in self._ignore_regions:
+            in_x = (centers_x >= left) & (centers_x < right)
+            in_y = (centers_y >= top) & (centers_y < bottom)
+            mask |= np.outer(in_y, in_x)
+        return mask
@@ -3,19 +3,26 @@ import time
 
 import dxcam
 
+from capture.frame_ring import FrameRing
+
 
 class DXCamCapture:
-    def __init__(self, monitor_index: int = 0, target_fps: int = 60) -> None:
+    def __init__(
+        self, monitor_index: int = 0, target_fps: int = 60, recorder=None, ring_size: int = 4
+    ) -> None:
         self._camera = dxcam.create(output_idx=monitor_index)
+        self._recorder = recorder
         self._target_fps = target_fps
-        self._lock = threading.Lock()
-        self._latest_frame = None
+        self._ring = FrameRing(ring_size)
+        self._demand = threading.Event()
+        self._throttle = 0.0
         self._running = False
         self._thread = None
         self._region = None
 
     def start(self, region) -> None:
         self._region = region
+        self._ring.open()
         self._running = True
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
@@ -23,20 +30,41 @@ class DXCamCapture:
     def _loop(self) -> None:
         interval = 1.0 / max(self._target_fps, 1)
         while self._running:
+            if not self._recorder and not self._demand.wait(timeout=0.5):
+                continue
             frame = self._camera.grab(region=self._region)
             if frame is not None:
-                with self._lock:
-                    self._latest_frame = frame
-            time.sleep(interval)
+                self._ring.publish(frame, time.monotonic())
+                self._demand.clear()
+                if self._recorder:
+                    self._recorder.write(frame)
+            time.sleep(max(interval, self._throttle))
+
+    def set_region(self, region) -> None:
+        self._region = region
+        self._demand.set()
+
+    def throttle(self, interval: float) -> None:
+        self._throttle = max(0.0, interval)
+
+    def get_frame(self, last_seq: int = 0):
+        return self._ring.latest(last_seq)
+
+    def wait_for_frame(self, last_seq: int = 0, timeout: float = None):
+        self._demand.set()
+        return self._ring.wait(last_seq, timeout=timeout)
 
     def get_latest_frame(self):
-        with self._lock:
-            if self._latest_frame is None:
-                return None
-            return self._latest_frame.copy()
+        self._demand.set()
+        _seq, frame, _timestamp = self._ring.latest()
+        return frame
 
     def stop(self) -> None:
         self._running = False
+        self._demand.set()
+        self._ring.close()
         if self._thread:
             self._thread.join(timeout=1.0)
         self._thread = None
+        if self._recorder:
+            self._recorder.close()
@@ -0,0 +1,52 @@
+import threading
+
+
+class FrameRing:
+    def __init__(self, size: int = 4) -> None:
+        self._size = max(2, size)
+        self._frames = [None] * self._size
+        self._times = [0.0] * self._size
+        self._seq = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def publish(self, frame, timestamp: float) -> int:
+        frame.flags.writeable = False
+        with self._changed:
+            self._seq += 1
+            slot = self._seq % self._size
+            self._frames[slot] = frame
+            self._times[slot] = timestamp
+            self._changed.notify_all()
+            return self._seq
+
+    def latest(self, last_seq: int = 0):
+        with self._lock:
+            return self._latest(last_seq)
+
+    def wait(self, last_seq: int = 0, timeout: float = None):
+        with self._changed:
+            self._changed.wait_for(lambda: self._closed or self._seq != last_seq, timeout=timeout)
+            return self._latest(last_seq)
+
+    def open(self) -> None:
+        with self._lock:
+            self._closed = False
+
+    def close(self) -> None:
+        with self._changed:
+            self._closed = True
+            self._frames = [None] * self._size
+            self._times = [0.0] * self._size
+            self._changed.notify_all()
+
+    def _latest(self, last_seq: int):
+        slot = self._seq % self._size
+        if self._seq == last_seq or self._frames[slot] is None:
+            return last_seq, None, 0.0
+        return self._seq, self._frames[slot], self._times[slot]
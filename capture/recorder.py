@@ -0,0 +1,144 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+FORMAT_VERSION = 1
+
+
+class FrameRecorder:
+    def __init__(self, path, max_fps: float = 10.0, on_segment=None) -> None:
+        self._base_path = Path(path)
+        self._path = self._base_path
+        self._on_segment = on_segment
+        self._segment = 1
+        self._min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._lock = threading.Lock()
+        self._frames_file = None
+        self._index_file = None
+        self._shape = None
+        self._dtype = None
+        self._last_frame = None
+        self._last_write = 0.0
+        self._start_time = None
+        self._frame_count = 0
+        self._entry_count = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(self, frame, timestamp: float | None = None) -> None:
+        if frame is None:
+            return
+        now = time.monotonic() if timestamp is None else timestamp
+        with self._lock:
+            if self._start_time is None:
+                self._open(frame, now)
+            elif frame.shape != self._shape or frame.dtype != self._dtype:
+                previous = self._shape
+                self._close_files()
+                self._segment += 1
+                self._path = self._base_path.with_name(
+                    f"{self._base_path.name}-{self._segment}"
+                )
+                self._open(frame, now)
+                if self._on_segment:
+                    self._on_segment(self._path, previous, frame.shape)
+            if now - self._last_write < self._min_interval:
+                return
+            self._last_write = now
+
+            if self._last_frame is None or not np.array_equal(frame, self._last_frame):
+                self._frames_file.write(np.ascontiguousarray(frame).tobytes())
+                self._frame_count += 1
+                self._last_frame = frame.copy()
+            record = np.array(
+                [now - self._start_time, self._frame_count - 1], dtype=np.float64
+            )
+            self._index_file.write(record.tobytes())
+            self._entry_count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_files()
+
+    def _close_files(self) -> None:
+        if self._frames_file:
+            self._frames_file.close()
+            self._frames_file = None
+        if self._index_file:
+            self._index_file.close()
+            self._index_file = None
+        if self._shape is not None:
+            self._write_meta()
+
+    def _open(self, frame, now: float) -> None:
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._shape = frame.shape
+        self._dtype = frame.dtype
+        self._start_time = now
+        self._last_frame = None
+        self._frame_count = 0
+        self._entry_count = 0
+        self._last_write = now - self._min_interval
+        self._frames_file = open(self._path / "frames.raw", "wb")
+        self._index_file = open(self._path / "index.raw", "wb")
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        meta = {
+            "version": FORMAT_VERSION,
+            "shape": list(self._shape),
+            "dtype": np.dtype(self._dtype).str,
+            "frames": self._frame_count,
+            "entries": self._entry_count,
+        }
+        (self._path / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+
+class Recording:
+    def __init__(self, path) -> None:
+        self._path = Path(path)
+        meta = json.loads((self._path / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version: {meta.get('version')}")
+        shape = tuple(meta["shape"])
+        dtype = np.dtype(meta["dtype"])
+        frame_bytes = int(np.prod(shape)) * dtype.itemsize
+        frames_path = self._path / "frames.raw"
+        frame_count = frames_path.stat().st_size // frame_bytes if frame_bytes else 0
+        if frame_count == 0:
+            raise ValueError(f"Recording has no frames: {self._path}")
+        self._frames = np.memmap(
+            frames_path, dtype=dtype, mode="r", shape=(frame_count,) + shape
+        )
+        index = np.fromfile(self._path / "index.raw", dtype=np.float64)
+        index = index[: (len(index) // 2) * 2].reshape(-1, 2)
+        index = index[index[:, 1] < frame_count]
+        self._timestamps = index[:, 0].copy()
+        self._frame_ids = index[:, 1].astype(np.int64)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def duration(self) -> float:
+        return float(self._timestamps[-1]) if len(self._timestamps) else 0.0
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def timestamp(self, position: int) -> float:
+        return float(self._timestamps[position])
+
+    def position_at(self, elapsed: float) -> int:
+        position = int(np.searchsorted(self._timestamps, elapsed, side="right")) - 1
+        return max(0, min(position, len(self._timestamps) - 1))
+
+    def frame(self, position: int):
+        return self._frames[self._frame_ids[position]]
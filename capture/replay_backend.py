@@ -0,0 +1,119 @@
+import threading
+import time
+
+from capture.recorder import Recording
+from utils.paths import resolve_path
+
+
+class ReplayCapture:
+    def __init__(self, path: str, realtime: bool = True, speed: float = 1.0, loop: bool = False) -> None:
+        self._recording = Recording(resolve_path(path))
+        self._realtime = realtime
+        self._speed = max(speed, 1e-6)
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._start_time = None
+        self._position = -1
+        self._finished = False
+        self._cycle = 0
+        self._served = 0
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    @property
+    def recording(self) -> Recording:
+        return self._recording
+
+    def start(self, region=None) -> None:
+        self._stopped.clear()
+        with self._lock:
+            self._start_time = time.monotonic()
+            self._position = -1
+            self._finished = False
+            self._cycle = 0
+            self._served = 0
+
+    def get_frame(self, last_seq: int = 0):
+        with self._lock:
+            if self._start_time is None or self._finished:
+                return last_seq, None, 0.0
+            position = self._next_position()
+            if position is None:
+                return last_seq, None, 0.0
+            if self._realtime:
+                seq = self._cycle * len(self._recording) + position + 1
+                if seq == last_seq:
+                    return last_seq, None, 0.0
+                offset = self._cycle * self._recording.duration + self._recording.timestamp(position)
+                timestamp = min(time.monotonic(), self._start_time + offset / self._speed)
+            else:
+                self._served += 1
+                seq = self._served
+                timestamp = time.monotonic()
+            self._position = position
+            return seq, self._recording.frame(position), timestamp
+
+    def wait_for_frame(self, last_seq: int = 0, timeout: float = None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            seq, frame, timestamp = self.get_frame(last_seq)
+            if frame is not None or self._finished or self._start_time is None:
+                return seq, frame, timestamp
+            delay = self._until_next_frame()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return last_seq, None, 0.0
+                delay = min(delay, remaining)
+            if self._stopped.wait(max(delay, 0.001)):
+                return last_seq, None, 0.0
+
+    def set_region(self, region) -> None:
+        pass
+
+    def throttle(self, interval: float) -> None:
+        pass
+
+    def get_latest_frame(self):
+        _seq, frame, _timestamp = self.get_frame()
+        return frame
+
+    def stop(self) -> None:
+        with self._lock:
+            self._start_time = None
+        self._stopped.set()
+
+    def _until_next_frame(self) -> float:
+        with self._lock:
+            if self._start_time is None or not self._realtime:
+                return 0.0
+            position = self._position + 1
+            if position < len(self._recording):
+                offset = self._cycle * self._recording.duration + self._recording.timestamp(position)
+            else:
+                offset = (self._cycle + 1) * self._recording.duration
+            return self._start_time + offset / self._speed - time.monotonic()
+
+    def _next_position(self):
+        count = len(self._recording)
+        if self._realtime:
+            elapsed = (time.monotonic() - self._start_time) * self._speed
+            duration = self._recording.duration
+            if elapsed > duration:
+                if not self._loop:
+                    self._finished = True
+                    return count - 1
+                self._cycle = int(elapsed // duration) if duration > 0 else 0
+                elapsed = elapsed % duration if duration > 0 else 0.0
+            return self._recording.position_at(elapsed)
+
+        position = self._position + 1
+        if position >= count:
+            if not self._loop:
+                self._finished = True
+                return None
+            position = 0
+        return position
@@ -0,0 +1,179 @@
+import time
+
+import cv2
+import numpy as np
+
+from ocr.postprocess import box_bounds, crop_box, ocr_result_to_text
+
+
+def _touches(box, region) -> bool:
+    left, top, right, bottom = box_bounds(box)
+    return left < region[2] and region[0] < right and top < region[3] and region[1] < bottom
+
+
+class BoxReuseOCREngine:
+    def __init__(
+        self,
+        engine,
+        redetect_interval_ms: int = 3000,
+        min_score: float = 0.5,
+        layout_diff_threshold: float = 24.0,
+        layout_changed_pixels: int = 2,
+        probe_width: int = 128,
+        line_cache=None,
+    ) -> None:
+        self._engine = engine
+        self._line_cache = line_cache
+        self._redetect_interval = redetect_interval_ms / 1000.0
+        self._min_score = min_score
+        self._layout_diff_threshold = layout_diff_threshold
+        self._layout_changed_pixels = layout_changed_pixels
+        self._probe_width = probe_width
+        self._boxes = []
+        self._recognized = []
+        self._shape = None
+        self._probe = None
+        self._probe_mask = None
+        self._detected_at = 0.0
+        self._detections = 0
+        self._reuses = 0
+        self._boxes_skipped = 0
+
+    @property
+    def error(self):
+        return self._engine.error
+
+    @property
+    def engine(self):
+        return self._engine
+
+    def reset(self) -> None:
+        self._boxes = []
+        self._recognized = []
+        self._shape = None
+        self._probe = None
+        self._probe_mask = None
+        self._detected_at = 0.0
+
+    def stats(self) -> dict:
+        stats = {
+            "detections": self._detections,
+            "box_reuses": self._reuses,
+            "boxes_skipped": self._boxes_skipped,
+        }
+        if self._line_cache:
+            stats.update(self._line_cache.stats())
+        if hasattr(self._engine, "stats"):
+            stats.update(self._engine.stats())
+        return stats
+
+    def recognize_lines(self, image_bgr, dirty=None):
+        now = time.monotonic()
+        probe = self._make_probe(image_bgr)
+        reused = not self._needs_detection(image_bgr, probe, now)
+        if not reused:
+            error = self._detect(image_bgr, probe, now)
+            if error:
+                return [], error
+
+        previous = self._recognized
+        lines, error = self._recognize(image_bgr, dirty if reused else None)
+        if error:
+            return [], error
+        if reused:
+            if self._lost_confidence(previous):
+                error = self._detect(image_bgr, probe, now)
+                if error:
+                    return [], error
+                lines, error = self._recognize(image_bgr)
+                if error:
+                    return [], error
+            else:
+                self._reuses += 1
+        return [line for line in lines if line[1] and line[2] >= self._min_score], None
+
+    def _lost_confidence(self, previous) -> bool:
+        for before, after in zip(previous, self._recognized):
+            if before is None or after is None:
+                continue
+            if before[1] >= self._min_score and after[1] < self._min_score:
+                return True
+        return False
+
+    def recognize_text(self, image_bgr):
+        lines, error = self.recognize_lines(image_bgr)
+        if error or not lines:
+            return "", error
+        return ocr_result_to_text(lines), None
+
+    def _needs_detection(self, image_bgr, probe, now: float) -> bool:
+        if self._shape != image_bgr.shape or self._probe is None:
+            return True
+        if now - self._detected_at >= self._redetect_interval:
+            return True
+        diff = cv2.absdiff(probe, self._probe)
+        outside = diff[~self._probe_mask]
+        changed = int(np.count_nonzero(outside >= self._layout_diff_threshold))
+        return changed >= self._layout_changed_pixels
+
+    def _detect(self, image_bgr, probe, now: float):
+        boxes, error = self._engine.detect_boxes(image_bgr)
+        if error:
+            self.reset()
+            return error
+        self._boxes = boxes
+        self._recognized = [None] * len(boxes)
+        self._shape = image_bgr.shape
+        self._probe = probe
+        self._probe_mask = self._make_probe_mask(image_bgr.shape, probe.shape)
+        self._detected_at = now
+        self._detections += 1
+        return None
+
+    def _recognize(self, image_bgr, dirty=None):
+        recognized = list(self._recognized)
+        indices = []
+        crops = []
+        for index, box in enumerate(self._boxes):
+            if dirty is not None and recognized[index] is not None and not _touches(box, dirty):
+                self._boxes_skipped += 1
+                continue
+            crop = crop_box(image_bgr, box)
+            recognized[index] = None
+            if crop is not None:
+                indices.append(index)
+                crops.append(crop)
+        if crops:
+            if self._line_cache:
+                results, error = self._line_cache.recognize(crops, self._engine.recognize_crops)
+            else:
+                results, error = self._engine.recognize_crops(crops)
+            if error:
+                return [], error
+            for index, result in zip(indices, results):
+                recognized[index] = result
+        self._recognized = recognized
+        return [
+            (box, result[0], result[1])
+            for box, result in zip(self._boxes, recognized)
+            if result is not None
+        ], None
+
+    def _make_probe(self, image_bgr):
+        height, width = image_bgr.shape[:2]
+        probe_w = min(self._probe_width, width)
+        probe_h = max(1, int(round(height * probe_w / max(width, 1))))
+        gray = cv2.cvtColor(image_bgr, cv2.COLOR_BGR2GRAY) if image_bgr.ndim == 3 else image_bgr
+        return cv2.resize(gray, (probe_w, probe_h), interpolation=cv2.INTER_AREA)
+
+    def _make_probe_mask(self, image_shape, probe_shape):
+        mask = np.zeros(probe_shape[:2], dtype=bool)
+        scale_y = probe_shape[0] / image_shape[0]
+        scale_x = probe_shape[1] / image_shape[1]
+        for box in self._boxes:
+            left, top, right, bottom = box_bounds(box)
+            mask[
+                max(0, int(top * scale_y) - 1) : int(np.ceil(bottom * scale_y)) + 1,
+                max(0, int(left * scale_x) - 1) : int(np.ceil(right * scale_x)) + 1,
+            ] = True
+        return mask
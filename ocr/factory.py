@@ -0,0 +1,60 @@
+import importlib
+
+import cv2
+import numpy as np
+
+
+_ENGINES = {
+    "paddleocr": ("ocr.paddleocr_engine", "PaddleOCREngine"),
+    "rapidocr_onnxruntime": ("ocr.rapidocr_engine", "RapidOCREngine"),
+}
+
+
+class UnavailableOCREngine:
+    def __init__(self, error: str) -> None:
+        self._error = error
+
+    @property
+    def error(self):
+        return self._error
+
+    def recognize_text(self, image_bgr):
+        return "", self._error
+
+    def recognize_lines(self, image_bgr):
+        return [], self._error
+
+
+def create_ocr_engine(ocr_cfg: dict, modular: bool = False):
+    name = ocr_cfg.get("engine", "rapidocr_onnxruntime")
+    if name not in _ENGINES:
+        name = "rapidocr_onnxruntime"
+    module_name, class_name = _ENGINES[name]
+    try:
+        engine_cls = getattr(importlib.import_module(module_name), class_name)
+    except ImportError as exc:
+        return UnavailableOCREngine(f"{name} unavailable: {exc}")
+
+    if name == "paddleocr":
+        paddle_cfg = ocr_cfg.get("paddle", {})
+        return engine_cls(
+            det_model_dir=paddle_cfg.get("det_model_dir", ""),
+            rec_model_dir=paddle_cfg.get("rec_model_dir", ""),
+            device=paddle_cfg.get("device", "cpu"),
+            modular=modular,
+        )
+    return engine_cls(
+        det_model_path=ocr_cfg["det_model_path"],
+        rec_model_path=ocr_cfg["rec_model_path"],
+        box_thresh=ocr_cfg["box_thresh"],
+        unclip_ratio=ocr_cfg["unclip_ratio"],
+        text_score=ocr_cfg["text_score"],
+    )
+
+
+def warmup_ocr_engine(engine) -> None:
+    if engine.error:
+        return
+    image = np.full((64, 320, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "Warm up 123", (10, 44), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+    engine.recognize_lines(image)
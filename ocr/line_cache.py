@@ -0,0 +1,45 @@
+import hashlib
+
+import cv2
+
+from utils.cache import LRUCache
+
+
+class LineRecognitionCache:
+    def __init__(self, max_entries: int = 2048, hash_height: int = 24, max_hash_width: int = 512) -> None:
+        self._cache = LRUCache(max_entries=max_entries)
+        self._hash_height = hash_height
+        self._max_hash_width = max_hash_width
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> dict:
+        return {"line_hits": self._hits, "line_misses": self._misses, "line_entries": len(self._cache)}
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def crop_key(self, crop) -> bytes:
+        gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+        height, width = gray.shape[:2]
+        hash_w = max(8, min(self._max_hash_width, int(round(width * self._hash_height / max(height, 1)))))
+        small = cv2.resize(gray, (hash_w, self._hash_height), interpolation=cv2.INTER_AREA)
+        small >>= 3
+        digest = hashlib.blake2b(small.tobytes(), digest_size=16)
+        digest.update(hash_w.to_bytes(4, "little"))
+        return digest.digest()
+
+    def recognize(self, crops, recognizer):
+        keys = [self.crop_key(crop) for crop in crops]
+        results = [self._cache.get(key) for key in keys]
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        self._hits += len(crops) - len(missing)
+        self._misses += len(missing)
+        if missing:
+            fresh, error = recognizer([crops[idx] for idx in missing])
+            if error:
+                return [], error
+            for idx, result in zip(missing, fresh):
+                results[idx] = result
+                self._cache.set(keys[idx], result)
+        return results, None
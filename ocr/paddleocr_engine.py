@@ -3,27 +3,36 @@ import os
 
 os.environ.setdefault("DISABLE_MODEL_SOURCE_CHECK", "true")
 
-from paddleocr import PaddleOCR
+from paddleocr import PaddleOCR, TextDetection, TextRecognition
 
+from ocr.postprocess import crop_box
 from utils.paths import resolve_path
 
 
 class PaddleOCREngine:
-    def __init__(self, det_model_dir: str, rec_model_dir: str, device: str = "cpu") -> None:
+    def __init__(
+        self, det_model_dir: str, rec_model_dir: str, device: str = "cpu", modular: bool = False
+    ) -> None:
         self._ocr = None
+        self._det = None
+        self._rec = None
         self._error = None
 
         try:
             det_dir = self._resolve_dir(det_model_dir)
             rec_dir = self._resolve_dir(rec_model_dir)
-            self._ocr = PaddleOCR(
-                text_detection_model_dir=det_dir,
-                text_recognition_model_dir=rec_dir,
-                use_doc_orientation_classify=False,
-                use_doc_unwarping=False,
-                use_textline_orientation=False,
-                device=device,
-            )
+            if modular:
+                self._det = TextDetection(model_dir=det_dir, device=device)
+                self._rec = TextRecognition(model_dir=rec_dir, device=device)
+            else:
+                self._ocr = PaddleOCR(
+                    text_detection_model_dir=det_dir,
+                    text_recognition_model_dir=rec_dir,
+                    use_doc_orientation_classify=False,
+                    use_doc_unwarping=False,
+                    use_textline_orientation=False,
+                    device=device,
+                )
         except Exception as exc:
             self._error = str(exc)
 
@@ -40,6 +49,9 @@ class PaddleOCREngine:
         return self._error
 
     def recognize_text(self, image_bgr):
+        if self._det:
+            lines, error = self.recognize_lines(image_bgr)
+            return "\n".join(text for _box, text, _score in lines), error
         if not self._ocr:
             return "", self._error
         try:
@@ -49,6 +61,99 @@ class PaddleOCREngine:
         except Exception as exc:
             return "", str(exc)
 
+    def recognize_lines(self, image_bgr):
+        if self._det:
+            boxes, error = self.detect_boxes(image_bgr)
+            if error or not boxes:
+                return [], error
+            crops = [crop_box(image_bgr, box) for box in boxes]
+            kept = [(box, crop) for box, crop in zip(boxes, crops) if crop is not None]
+            results, error = self.recognize_crops([crop for _box, crop in kept])
+            if error:
+                return [], error
+            return [
+                (box, text, score)
+                for (box, _crop), (text, score) in zip(kept, results)
+                if text
+            ], None
+        if not self._ocr:
+            return [], self._error
+        try:
+            result = self._ocr.ocr(image_bgr)
+            return self._extract_lines(result), None
+        except Exception as exc:
+            return [], str(exc)
+
+    def detect_boxes(self, image_bgr):
+        if not self._det:
+            return [], self._error or "Text detection module not loaded."
+        try:
+            boxes = []
+            for item in self._det.predict(image_bgr):
+                for poly in item.get("dt_polys", []) or []:
+                    boxes.append([[float(pt[0]), float(pt[1])] for pt in poly])
+            return boxes, None
+        except Exception as exc:
+            return [], str(exc)
+
+    def recognize_crops(self, crops):
+        if not self._rec:
+            return [], self._error or "Text recognition module not loaded."
+        if not crops:
+            return [], None
+        try:
+            results = []
+            for item in self._rec.predict(crops, batch_size=len(crops)):
+                results.append((item.get("rec_text", "") or "", float(item.get("rec_score", 0.0))))
+            return results, None
+        except Exception as exc:
+            return [], str(exc)
+
+    def _extract_lines(self, result) -> list:
+        if not result:
+            return []
+
+        if isinstance(result, list) and result and isinstance(result[0], dict):
+            lines = []
+            for item in result:
+                texts = item.get("rec_texts", []) or []
+                scores = item.get("rec_scores", []) or []
+                polys = item.get("rec_polys")
+                if polys is None:
+                    polys = item.get("dt_polys", []) or []
+                for idx, text in enumerate(texts):
+                    if not text or idx >= len(polys):
+                        continue
+                    box = [[float(pt[0]), float(pt[1])] for pt in polys[idx]]
+                    score = float(scores[idx]) if idx < len(scores) else 1.0
+                    lines.append((box, text, score))
+            return lines
+
+        candidates = result
+        if (
+            isinstance(result, list)
+            and len(result) == 1
+            and isinstance(result[0], list)
+            and result[0]
+            and isinstance(result[0][0], (list, tuple))
+        ):
+            candidates = result[0]
+
+        lines = []
+        for line in candidates:
+            if not isinstance(line, (list, tuple)) or len(line) < 2:
+                continue
+            box, text_part = line[0], line[1]
+            if isinstance(text_part, (list, tuple)) and text_part:
+                text = text_part[0]
+                score = float(text_part[1]) if len(text_part) > 1 else 1.0
+            else:
+                text = str(text_part)
+                score = 1.0
+            if text:
+                lines.append(([[float(pt[0]), float(pt[1])] for pt in box], text, score))
+        return lines
+
     def _extract_text(self, result) -> str:
         if not result:
             return ""
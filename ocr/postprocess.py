@@ -1,3 +1,6 @@
+import math
+
+
 def merge_lines(ocr_result, line_gap: int = 10):
     if not ocr_result:
         return []
@@ -27,3 +30,60 @@ def merge_lines(ocr_result, line_gap: int = 10):
 
 def ocr_result_to_text(ocr_result, line_gap: int = 10) -> str:
     return "\n".join(merge_lines(ocr_result, line_gap=line_gap))
+
+
+def box_bounds(box):
+    xs = [pt[0] for pt in box]
+    ys = [pt[1] for pt in box]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def crop_box(image, box, margin: int = 2):
+    height, width = image.shape[:2]
+    left, top, right, bottom = box_bounds(box)
+    left = max(0, int(left) - margin)
+    top = max(0, int(top) - margin)
+    right = min(width, int(math.ceil(right)) + margin)
+    bottom = min(height, int(math.ceil(bottom)) + margin)
+    if right <= left or bottom <= top:
+        return None
+    return image[top:bottom, left:right].copy()
+
+
+def offset_result(ocr_result, dx: int, dy: int):
+    return [
+        ([[pt[0] + dx, pt[1] + dy] for pt in box], text, score)
+        for box, text, score in ocr_result
+    ]
+
+
+def _intersects(a, b) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def expand_region(region, layout, width: int, height: int, padding: int = 0):
+    left, top, right, bottom = region
+    left, top = max(0, left - padding), max(0, top - padding)
+    right, bottom = min(width, right + padding), min(height, bottom + padding)
+    changed = True
+    while changed:
+        changed = False
+        for box, _text, _score in layout:
+            bounds = box_bounds(box)
+            if not _intersects(bounds, (left, top, right, bottom)):
+                continue
+            grown = (
+                max(0, min(left, int(bounds[0]))),
+                max(0, min(top, int(bounds[1]))),
+                min(width, max(right, int(math.ceil(bounds[2])))),
+                min(height, max(bottom, int(math.ceil(bounds[3])))),
+            )
+            if grown != (left, top, right, bottom):
+                left, top, right, bottom = grown
+                changed = True
+    return left, top, right, bottom
+
+
+def merge_layout(layout, fresh, region):
+    kept = [item for item in layout if not _intersects(box_bounds(item[0]), region)]
+    return kept + list(fresh)
@@ -0,0 +1,235 @@
+import multiprocessing
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ocr.postprocess import ocr_result_to_text
+
+
+_ALIGN = 64
+_MIN_SEGMENT = 4 * 1024 * 1024
+
+
+def _attach(name: str):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _plain_lines(lines):
+    return [
+        ([[float(pt[0]), float(pt[1])] for pt in box], text, float(score))
+        for box, text, score in lines or []
+    ]
+
+
+def _worker(conn, ocr_cfg: dict, modular: bool, warmup: bool) -> None:
+    from ocr.factory import create_ocr_engine, warmup_ocr_engine
+
+    engine = create_ocr_engine(ocr_cfg, modular=modular)
+    if warmup:
+        warmup_ocr_engine(engine)
+    conn.send(engine.error)
+    if engine.error:
+        return
+
+    segment = None
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+            method, name, specs = request
+            if segment is None or segment.name != name:
+                if segment is not None:
+                    segment.close()
+                segment = _attach(name)
+            arrays = [
+                np.ndarray(shape, dtype=dtype, buffer=segment.buf, offset=offset)
+                for offset, shape, dtype in specs
+            ]
+            try:
+                if method == "recognize_crops":
+                    result = engine.recognize_crops(arrays)
+                else:
+                    result = getattr(engine, method)(arrays[0])
+            except Exception as exc:
+                result = ([], str(exc))
+            del arrays
+            if method == "recognize_lines":
+                result = (_plain_lines(result[0]), result[1])
+            conn.send(result)
+    finally:
+        if segment is not None:
+            segment.close()
+
+
+class ProcessOCREngine:
+    def __init__(
+        self,
+        ocr_cfg: dict,
+        modular: bool = False,
+        warmup: bool = True,
+        timeout_ms: int = 5000,
+        start_timeout_ms: int = 120000,
+        max_restarts: int = 5,
+        retry_ms: int = 30000,
+    ) -> None:
+        self._ocr_cfg = ocr_cfg
+        self._modular = modular
+        self._warmup = warmup
+        self._timeout = timeout_ms / 1000.0
+        self._start_timeout = start_timeout_ms / 1000.0
+        self._max_restarts = max_restarts
+        self._retry_after = retry_ms / 1000.0
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._segment = None
+        self._calls = 0
+        self._restarts = 0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._retry_error = None
+        self._error = self._spawn()
+
+    @property
+    def error(self):
+        return self._error
+
+    def stats(self) -> dict:
+        return {"ocr_process_calls": self._calls, "ocr_process_restarts": self._restarts}
+
+    def recognize_lines(self, image_bgr):
+        return self._call("recognize_lines", [image_bgr])
+
+    def recognize_text(self, image_bgr):
+        lines, error = self.recognize_lines(image_bgr)
+        if error or not lines:
+            return "", error
+        return ocr_result_to_text(lines), None
+
+    def detect_boxes(self, image_bgr):
+        return self._call("detect_boxes", [image_bgr])
+
+    def recognize_crops(self, crops):
+        if not crops:
+            return [], None
+        return self._call("recognize_crops", list(crops))
+
+    def close(self) -> None:
+        with self._lock:
+            self._shutdown()
+            if self._segment is not None:
+                self._segment.close()
+                self._segment.unlink()
+                self._segment = None
+
+    def _call(self, method: str, arrays: list):
+        with self._lock:
+            if self._error:
+                return [], self._error
+            if self._process is None or not self._process.is_alive():
+                error = self._restart()
+                if error:
+                    return [], error
+            self._calls += 1
+            specs = self._write(arrays)
+            try:
+                self._conn.send((method, self._segment.name, specs))
+                if not self._conn.poll(self._timeout):
+                    raise TimeoutError(f"no reply within {self._timeout:.1f}s")
+                result = self._conn.recv()
+            except (EOFError, OSError, TimeoutError) as exc:
+                reason = str(exc) or "worker exited"
+                error = self._restart()
+                return [], error or f"OCR worker restarted: {reason}"
+            self._failures = 0
+            return result
+
+    def _write(self, arrays: list):
+        specs = []
+        offset = 0
+        for array in arrays:
+            specs.append((offset, array.shape, array.dtype.str))
+            offset += -(-array.nbytes // _ALIGN) * _ALIGN
+        self._ensure_segment(offset)
+        for (start, shape, dtype), array in zip(specs, arrays):
+            view = np.ndarray(shape, dtype=dtype, buffer=self._segment.buf, offset=start)
+            view[...] = array
+            del view
+        return specs
+
+    def _ensure_segment(self, size: int) -> None:
+        if self._segment is not None and self._segment.size >= size:
+            return
+        if self._segment is not None:
+            self._segment.close()
+            self._segment.unlink()
+        self._segment = shared_memory.SharedMemory(create=True, size=max(size * 2, _MIN_SEGMENT))
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker,
+            args=(child_conn, self._ocr_cfg, self._modular, self._warmup),
+            name="ocr-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        try:
+            if not parent_conn.poll(self._start_timeout):
+                self._shutdown()
+                return "OCR worker did not start in time"
+            error = parent_conn.recv()
+        except (EOFError, OSError):
+            error = "OCR worker exited during startup"
+        if error:
+            self._shutdown()
+        return error
+
+    def _restart(self):
+        self._shutdown()
+        now = time.monotonic()
+        if now < self._retry_at:
+            return self._retry_error
+        self._failures += 1
+        if self._failures > self._max_restarts:
+            self._failures = 0
+            self._retry_at = now + self._retry_after
+            self._retry_error = (
+                f"OCR worker failed {self._max_restarts} times in a row; "
+                f"retrying in {self._retry_after:.0f}s"
+            )
+            return self._retry_error
+        self._restarts += 1
+        error = self._spawn()
+        if error:
+            self._retry_at = time.monotonic() + self._retry_after
+            self._retry_error = error
+        return error
+
+    def _shutdown(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self._conn.close()
+            self._conn = None
+        if self._process is not None:
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join(timeout=1.0)
+            self._process = None
@@ -53,6 +53,46 @@ class RapidOCREngine:
         result, _ = self._engine(image_bgr, **self._params)
         return result, None
 
+    def recognize_lines(self, image_bgr):
+        if not self._engine:
+            return [], self._error
+        try:
+            result, _ = self._engine(image_bgr, **self._params)
+        except Exception as exc:
+            return [], str(exc)
+        return [(box, text, float(score)) for box, text, score in result or []], None
+
+    def detect_boxes(self, image_bgr):
+        if not self._engine:
+            return [], self._error
+        try:
+            result, _ = self._engine(
+                image_bgr,
+                use_det=True,
+                use_cls=False,
+                use_rec=False,
+                box_thresh=self._params["box_thresh"],
+                unclip_ratio=self._params["unclip_ratio"],
+            )
+        except Exception as exc:
+            return [], str(exc)
+        return [[[float(pt[0]), float(pt[1])] for pt in box] for box in result or []], None
+
+    def recognize_crops(self, crops):
+        if not self._engine:
+            return [], self._error
+        results = []
+        try:
+            for crop in crops:
+                result, _ = self._engine(crop, use_det=False, use_cls=False, use_rec=True)
+                if result:
+                    results.append((result[0][0], float(result[0][1])))
+                else:
+                    results.append(("", 0.0))
+        except Exception as exc:
+            return [], str(exc)
+        return results, None
+
     def recognize_text(self, image_bgr):
         result, error = self.recognize(image_bgr)
         if error or not result:
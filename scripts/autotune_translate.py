@@ -0,0 +1,223 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import argparse
+import copy
+import itertools
+import json
+import os
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from translate.factory import create_translator, engine_name
+from utils.config import load_config, save_user_config
+
+
+SAMPLES = {
+    "en": [
+        "Hello.",
+        "Where are you going?",
+        "The door is locked. You need a key.",
+        "I have been waiting for you since this morning.",
+        "Press the button to continue.",
+        "We should leave before the storm reaches the village.",
+        "Thank you for your help, I will never forget it.",
+        "The quest reward has been added to your inventory.",
+    ],
+    "ja": [
+        "こんにちは。",
+        "どこへ行くの？",
+        "扉には鍵がかかっている。鍵が必要だ。",
+        "今朝からずっと君を待っていたんだ。",
+        "ボタンを押して続けてください。",
+        "嵐が村に来る前に出発しよう。",
+        "助けてくれてありがとう、絶対に忘れないよ。",
+        "クエストの報酬が持ち物に追加されました。",
+    ],
+}
+
+CT2_ENGINES = ("ct2", "ct2_nllb", "ct2_cascade")
+
+
+def parse_list(value: str, cast=str) -> list:
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def load_corpus(path: str | None, lang: str) -> list[str]:
+    if path:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        return [line.strip() for line in lines if line.strip()]
+    return list(SAMPLES.get(lang, SAMPLES["en"]))
+
+
+def supported_compute_types(device: str) -> set | None:
+    try:
+        import ctranslate2
+    except ImportError:
+        return None
+    try:
+        return set(ctranslate2.get_supported_compute_types(device))
+    except Exception:
+        return set()
+
+
+def measure(translator, corpus: list[str], rounds: int, batch_size: int, workers: int) -> dict:
+    latencies = []
+    for _ in range(rounds):
+        for sentence in corpus:
+            started = time.perf_counter()
+            _outputs, error = translator.translate_many([sentence])
+            if error:
+                return {"error": error}
+            latencies.append(time.perf_counter() - started)
+
+    batches = [
+        corpus[index : index + batch_size] for index in range(0, len(corpus), batch_size)
+    ] * rounds
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda batch: translator.translate_many(batch)[1], batches))
+    elapsed = time.perf_counter() - started
+    errors = [error for error in results if error]
+    if errors:
+        return {"error": errors[0]}
+    return {
+        "p50_ms": round(percentile(latencies, 0.50) * 1000.0, 2),
+        "p90_ms": round(percentile(latencies, 0.90) * 1000.0, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000.0, 2),
+        "sentences_per_s": round(len(corpus) * rounds / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+def main() -> int:
+    cpus = os.cpu_count() or 4
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--engine", choices=CT2_ENGINES, default=None, help="Defaults to config")
+    parser.add_argument("--model-dir", default=None, help="Override model_dir (ct2, ct2_nllb)")
+    parser.add_argument("--first-model-dir", default=None, help="Override ct2_cascade first model")
+    parser.add_argument("--second-model-dir", default=None, help="Override ct2_cascade second model")
+    parser.add_argument("--corpus", default=None, help="Text file with one sentence per line")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--compute-types", default="int8,int8_float32,float32")
+    parser.add_argument("--beam-sizes", default="1,2")
+    parser.add_argument("--batch-sizes", default="1,4,8")
+    parser.add_argument(
+        "--inter-threads", default=",".join(str(n) for n in sorted({1, 2, max(1, cpus // 4)}))
+    )
+    parser.add_argument(
+        "--intra-threads", default=",".join(str(n) for n in sorted({0, max(1, cpus // 2)}))
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--objective",
+        choices=("latency", "throughput"),
+        default="latency",
+        help="latency minimises p90 per sentence, throughput maximises sentences/s",
+    )
+    parser.add_argument("--output", default=None, help="Write all results as JSON")
+    parser.add_argument("--dry-run", action="store_true", help="Do not write config/user.json")
+    args = parser.parse_args()
+
+    config = load_config()
+    translate_cfg = copy.deepcopy(config["translate"])
+    if args.engine:
+        translate_cfg["engine"] = args.engine
+    name = engine_name(translate_cfg)
+    if name not in CT2_ENGINES:
+        print(f"Autotune supports {', '.join(CT2_ENGINES)}; config uses {name}.")
+        return 1
+    if name == "ct2_cascade":
+        if args.model_dir:
+            print("ct2_cascade uses --first-model-dir and --second-model-dir, not --model-dir.")
+            return 1
+        model_dirs = {
+            "first_model_dir": args.first_model_dir,
+            "second_model_dir": args.second_model_dir,
+        }
+    else:
+        if args.first_model_dir or args.second_model_dir:
+            print(f"{name} uses --model-dir.")
+            return 1
+        model_dirs = {"model_dir": args.model_dir}
+    model_dirs = {key: value for key, value in model_dirs.items() if value}
+    translate_cfg.setdefault(name, {}).update(model_dirs)
+
+    corpus = load_corpus(args.corpus, translate_cfg.get("from", "en"))
+    if not corpus:
+        print("Corpus is empty.")
+        return 1
+
+    compute_types = parse_list(args.compute_types)
+    supported = supported_compute_types(args.device)
+    if supported:
+        compute_types = [value for value in compute_types if value in supported]
+    grid = list(
+        itertools.product(
+            compute_types,
+            parse_list(args.beam_sizes, int),
+            parse_list(args.batch_sizes, int),
+            parse_list(args.inter_threads, int),
+            parse_list(args.intra_threads, int),
+        )
+    )
+    print(f"{name}: {len(grid)} settings, {len(corpus)} sentences x {args.rounds} rounds")
+
+    results = []
+    for compute_type, beam_size, batch_size, inter_threads, intra_threads in grid:
+        settings = {
+            "device": args.device,
+            "compute_type": compute_type,
+            "beam_size": beam_size,
+            "max_batch_size": batch_size,
+            "inter_threads": inter_threads,
+            "intra_threads": intra_threads,
+        }
+        candidate_cfg = copy.deepcopy(translate_cfg)
+        candidate_cfg[name].update(settings)
+        started = time.perf_counter()
+        translator = create_translator(candidate_cfg)
+        load_s = time.perf_counter() - started
+        if translator.error:
+            result = {"error": translator.error}
+        else:
+            translator.translate_many(corpus[:batch_size])
+            result = measure(translator, corpus, args.rounds, batch_size, inter_threads)
+            result["load_s"] = round(load_s, 2)
+        del translator
+        result["settings"] = settings
+        results.append(result)
+        print(json.dumps(result, ensure_ascii=False))
+
+    valid = [result for result in results if "error" not in result]
+    if not valid:
+        print("No setting produced a working translator.")
+        return 1
+    if args.objective == "throughput":
+        best = max(valid, key=lambda result: (result["sentences_per_s"], -result["p90_ms"]))
+    else:
+        best = min(valid, key=lambda result: (result["p90_ms"], -result["sentences_per_s"]))
+    print("Best:", json.dumps(best, ensure_ascii=False))
+
+    if args.output:
+        report = {"engine": name, "objective": args.objective, "results": results, "best": best}
+        Path(args.output).write_text(
+            json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+    if not args.dry_run:
+        update = {"translate": {"engine": name, name: {**best["settings"], **model_dirs}}}
+        save_user_config(update)
+        print("Saved to config/user.json")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+from pathlib import Path
+import argparse
+import json
+import random
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.sentence_buffer import SentenceBuffer
+
+
+class QuadraticOverlapBuffer(SentenceBuffer):
+    def _overlap_len(self, new: str) -> int:
+        prev = self._buffer
+        if new.startswith(prev):
+            return len(prev)
+        if prev.startswith(new):
+            return len(new)
+        prev_lower = prev.lower()
+        new_lower = new.lower()
+        max_k = min(len(prev_lower), len(new_lower))
+        for k in range(max_k, self._min_overlap - 1, -1):
+            if prev_lower[-k:] == new_lower[:k]:
+                return k
+        return 0
+
+
+def make_source(rng: random.Random, length: int) -> str:
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do"]
+    text = ""
+    while len(text) < length:
+        text += rng.choice(words) + " "
+    return text[:length]
+
+
+def typewriter(source: str, step: int):
+    for end in range(step, len(source) + 1, step):
+        yield source[:end]
+
+
+def scrolling(source: str, window: int, step: int):
+    for start in range(0, len(source) - window + 1, step):
+        yield source[start : start + window]
+
+
+def unrelated(source: str, window: int, step: int):
+    for start in range(0, len(source) - window + 1, step):
+        yield source[start : start + window][::-1]
+
+
+def run(buffer_cls, texts, max_chars: int, tail: int) -> float:
+    buffer = buffer_cls(merge_gap_ms=10**9, max_hold_ms=0, max_chars=max_chars, end_punct="\u0000")
+    texts = list(texts)
+    for text in texts[:-tail]:
+        buffer.update(text, 0.0)
+    start = time.perf_counter()
+    for text in texts[-tail:]:
+        buffer.update(text, 0.0)
+    return (time.perf_counter() - start) / tail * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="300,1000,3000,6000")
+    parser.add_argument("--window", type=int, default=120, help="Visible characters in the scrolling case")
+    parser.add_argument("--step", type=int, default=3, help="Characters revealed per update")
+    parser.add_argument("--tail", type=int, default=100, help="Updates timed near the full buffer size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        source = make_source(rng, size)
+        for name, texts in (
+            ("typewriter", lambda: typewriter(source, args.step)),
+            ("scrolling", lambda: scrolling(source, args.window, args.step)),
+            ("no_overlap", lambda: unrelated(source, args.window, args.step)),
+            ("periodic", lambda: scrolling("a" * size, args.window, args.step)),
+        ):
+            report.append(
+                {
+                    "case": name,
+                    "max_chars": size,
+                    "current_us": round(run(SentenceBuffer, texts(), size + 1, args.tail), 2),
+                    "legacy_overlap_us": round(run(QuadraticOverlapBuffer, texts(), size + 1, args.tail), 2),
+                }
+            )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
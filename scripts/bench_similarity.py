@@ -0,0 +1,95 @@
+from difflib import SequenceMatcher
+from pathlib import Path
+import argparse
+import json
+import random
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.similarity import similarity_at_least
+
+
+def make_text(rng: random.Random, length: int, cjk: bool) -> str:
+    if cjk:
+        return "".join(chr(0x4E00 + rng.randrange(600)) for _ in range(length))
+    words = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "again", "today"]
+    text = ""
+    while len(text) < length:
+        text += rng.choice(words) + " "
+    return text[:length]
+
+
+def mutate(rng: random.Random, text: str, edits: int, cjk: bool) -> str:
+    chars = list(text)
+    for _ in range(edits):
+        pos = rng.randrange(len(chars)) if chars else 0
+        op = rng.randrange(3)
+        ch = chr(0x4E00 + rng.randrange(600)) if cjk else rng.choice("abcdefghij ")
+        if op == 0 and chars:
+            chars[pos] = ch
+        elif op == 1 and chars:
+            del chars[pos]
+        else:
+            chars.insert(pos, ch)
+    return "".join(chars)
+
+
+def time_call(func, pairs, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for a, b in pairs:
+            func(a, b)
+    return (time.perf_counter() - start) / (repeat * len(pairs)) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.92)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report = []
+    for cjk in (True, False):
+        for length in (40, 120, 300):
+            for edits in (0, length // 20, length // 3):
+                pairs = []
+                for _ in range(args.pairs):
+                    text = make_text(rng, length, cjk)
+                    pairs.append((text, mutate(rng, text, edits, cjk)))
+                mismatches = sum(
+                    1
+                    for a, b in pairs
+                    if a != b
+                    and similarity_at_least(a, b, args.threshold)
+                    != (SequenceMatcher(None, a, b).ratio() >= args.threshold)
+                )
+                report.append(
+                    {
+                        "script": "cjk" if cjk else "latin",
+                        "length": length,
+                        "edits": edits,
+                        "difflib_us": round(
+                            time_call(lambda a, b: SequenceMatcher(None, a, b).ratio(), pairs, args.repeat), 2
+                        ),
+                        "at_least_us": round(
+                            time_call(
+                                lambda a, b: similarity_at_least(a, b, args.threshold), pairs, args.repeat
+                            ),
+                            2,
+                        ),
+                        "decision_mismatches": mismatches,
+                    }
+                )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
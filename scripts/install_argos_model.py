@@ -1,3 +1,4 @@
+from pathlib import Path
 import argparse
 
 import argostranslate.package
@@ -26,6 +27,18 @@ def main() -> int:
     path = match.download()
     print(f"Installing from {path}...")
     argostranslate.package.install_from_path(path)
+    installed = next(
+        (
+            pkg
+            for pkg in argostranslate.package.get_installed_packages()
+            if pkg.from_code == from_code and pkg.to_code == to_code
+        ),
+        None,
+    )
+    if installed:
+        package_path = Path(installed.package_path)
+        direct = (package_path / "model").exists() and (package_path / "sentencepiece.model").exists()
+        print(f"Direct CT2 mode: {'available' if direct else 'not available'} ({package_path})")
     print("Done.")
     return 0
 
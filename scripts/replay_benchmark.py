@@ -0,0 +1,98 @@
+from pathlib import Path
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtCore, QtGui
+
+from app.controller import PipelineController
+from utils.config import load_config
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("recording", help="Directory written by app/main.py --record")
+    parser.add_argument("--fast", action="store_true", help="Replay as fast as possible")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--drain", type=float, default=2.0, help="Seconds to wait after the last frame")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--output", default=None, help="Write the report as JSON")
+    args = parser.parse_args()
+
+    config = load_config()
+    config.setdefault("input", {})["mode"] = "ocr"
+    capture_cfg = config["capture"]
+    capture_cfg["backend"] = "replay"
+    capture_cfg["record"] = {"enabled": False}
+    capture_cfg["replay"] = {
+        "path": str(Path(args.recording).resolve()),
+        "realtime": not args.fast,
+        "speed": args.speed,
+        "loop": False,
+    }
+
+    app = QtGui.QGuiApplication(sys.argv)
+    controller = PipelineController(config)
+    counts = {"ocr": 0, "translations": 0}
+    last_activity = [time.monotonic()]
+
+    def on_ocr(_text):
+        counts["ocr"] += 1
+        last_activity[0] = time.monotonic()
+
+    def on_translation(_text):
+        counts["translations"] += 1
+        last_activity[0] = time.monotonic()
+
+    controller.ocr_ready.connect(on_ocr)
+    controller.translation_ready.connect(on_translation)
+    controller.status.connect(print)
+
+    start = time.monotonic()
+    finished_at = [None]
+
+    def poll():
+        now = time.monotonic()
+        if controller.capture_finished and finished_at[0] is None:
+            finished_at[0] = now
+        done = finished_at[0] is not None and now - max(finished_at[0], last_activity[0]) >= args.drain
+        if done or now - start >= args.timeout:
+            controller.stop()
+            app.quit()
+
+    timer = QtCore.QTimer()
+    timer.timeout.connect(poll)
+    timer.start(100)
+
+    roi = tuple(capture_cfg.get("roi", (0, 0, 100, 100)))
+    controller.start(roi)
+    app.exec()
+
+    elapsed = (finished_at[0] or time.monotonic()) - start
+    report = {
+        "recording": capture_cfg["replay"]["path"],
+        "realtime": not args.fast,
+        "elapsed_s": round(elapsed, 3),
+        "ocr_results": counts["ocr"],
+        "translations": counts["translations"],
+        "translations_per_s": round(counts["translations"] / elapsed, 3) if elapsed > 0 else 0.0,
+        "metrics": controller.get_metrics(),
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
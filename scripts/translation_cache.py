@@ -0,0 +1,52 @@
+from pathlib import Path
+import argparse
+import json
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from utils.cache import PersistentCache
+from utils.config import load_config
+from utils.paths import resolve_path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", default=None, help="Cache file (defaults to config)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats")
+    export_parser = sub.add_parser("export")
+    export_parser.add_argument("output")
+    export_parser.add_argument("--namespace", default=None)
+    import_parser = sub.add_parser("import")
+    import_parser.add_argument("input")
+    clear_parser = sub.add_parser("clear")
+    clear_parser.add_argument("--namespace", default=None)
+    args = parser.parse_args()
+
+    persistent_cfg = load_config()["pipeline"]["cache"].get("persistent", {})
+    path = args.path or resolve_path(persistent_cfg.get("path", "cache/translations.sqlite3"))
+    max_bytes = int(float(persistent_cfg.get("max_mb", 64)) * 1024 * 1024)
+    store = PersistentCache(path, max_bytes=max_bytes)
+
+    try:
+        if args.command == "stats":
+            print(json.dumps(store.stats(), indent=2))
+        elif args.command == "export":
+            count = store.export(args.output, namespace=args.namespace)
+            print(f"Exported {count} entries to {args.output}")
+        elif args.command == "import":
+            count = store.import_file(args.input)
+            print(f"Imported {count} entries from {args.input}")
+        elif args.command == "clear":
+            count = store.clear(namespace=args.namespace)
+            print(f"Removed {count} entries")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
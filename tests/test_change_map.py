@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from capture.change_map import TileChangeDetector
+
+
+def _changed_region(width: int, height: int, x0: int, y0: int, x1: int, y1: int):
+    detector = TileChangeDetector(tile_size=32, samples=4, mad_threshold=3.0)
+    frame = np.zeros((height, width), dtype=np.uint8)
+    detector.update(frame)
+    changed = frame.copy()
+    changed[y0:y1, x0:x1] = 255
+    _tiles, region = detector.update(changed)
+    return region
+
+
+def test_region_covers_change_when_roi_is_not_a_tile_multiple():
+    region = _changed_region(1000, 210, 940, 150, 990, 190)
+    assert region is not None
+    left, top, right, bottom = region
+    assert left <= 940 and right >= 990
+    assert top <= 150 and bottom >= 190
+    assert right <= 1000 and bottom <= 210
+    # Each tile spans width / cols pixels, so the box stays within one tile of the change.
+    assert 940 - left < 1000 / 32 and right - 990 < 1000 / 32
+    assert 150 - top < 210 / 7 and bottom - 190 < 210 / 7
+
+
+def test_region_is_exact_for_tile_multiple():
+    assert _changed_region(256, 64, 40, 10, 60, 20) == (32, 0, 64, 32)
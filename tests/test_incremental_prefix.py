@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ctranslate2")
+
+from translate.ct2_engine import CT2Translator
+from translate.ct2_nllb import CT2NLLBTranslator
+from translate.incremental import PrefixTracker
+
+
+# Like ctranslate2.Translator.generate_tokens, the forced target_prefix is yielded too.
+class FakeGenerator:
+    def __init__(self, output: list[str]) -> None:
+        self.output = output
+        self.prefixes = []
+
+    def generate_tokens(self, source, target_prefix=None, max_decoding_length=256):
+        prefix = list(target_prefix or [])
+        self.prefixes.append(prefix)
+        assert self.output[: len(prefix)] == prefix
+        for index, token in enumerate(self.output):
+            yield SimpleNamespace(token=token, is_last=index == len(self.output) - 1)
+
+
+class FakeTokenizer:
+    def encode(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+def _engine(cls, generator, **attrs):
+    engine = cls.__new__(cls)
+    engine._translator = generator
+    engine._tokenizer = FakeTokenizer()
+    engine._error = None
+    engine._beam_size = 1
+    engine._max_batch_size = 1
+    for name, value in attrs.items():
+        setattr(engine, name, value)
+    return engine
+
+
+def test_ct2_prefix_reuse_returns_prefix_plus_continuation():
+    generator = FakeGenerator(["d", "e", "f", "g"])
+    engine = _engine(CT2Translator, generator)
+    tokens, error = engine.translate_tokens("a b c", target_prefix=["d", "e"])
+    assert error is None
+    assert tokens == ["d", "e", "f", "g"]
+
+
+def test_nllb_prefix_reuse_strips_language_token():
+    generator = FakeGenerator(["zho_Hans", "d", "e", "f", "g"])
+    engine = _engine(CT2NLLBTranslator, generator, _target_token="zho_Hans")
+    tracker = PrefixTracker(rollback_tokens=1, min_prefix_tokens=1)
+
+    tokens, error = engine.translate_tokens("a b", target_prefix=tracker.prefix_for("a b"))
+    assert error is None
+    assert tokens == ["d", "e", "f", "g"]
+    tracker.update("a b", tokens)
+
+    prefix = tracker.prefix_for("a b c")
+    assert prefix == ["d", "e", "f"]
+    tokens, error = engine.translate_tokens("a b c", target_prefix=prefix)
+    assert error is None
+    assert generator.prefixes[-1] == ["zho_Hans", "d", "e", "f"]
+    assert tokens == prefix + ["g"]
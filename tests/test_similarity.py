@@ -0,0 +1,17 @@
+import random
+from difflib import SequenceMatcher
+
+from utils.similarity import similarity_at_least
+
+
+def test_similarity_at_least_matches_sequence_matcher():
+    rng = random.Random(0)
+    for _ in range(5000):
+        a = "".join(rng.choice("abcde ") for _ in range(rng.randint(1, 40)))
+        cut = rng.randint(0, len(a))
+        b = a[:cut] + rng.choice(["", "x", "ab", "e d"]) + a[rng.randint(cut, len(a)) :]
+        if a == b:
+            continue
+        threshold = rng.choice([0.5, 0.8, 0.85, 0.9, 0.92, 0.95])
+        expected = SequenceMatcher(None, a, b).ratio() >= threshold
+        assert similarity_at_least(a, b, threshold) == expected, (a, b, threshold)
@@ -1,13 +1,49 @@
+from pathlib import Path
 import os
+import threading
+import time
 
+import argostranslate.package
+import argostranslate.settings
 import argostranslate.translate
 
+try:
+    import ctranslate2
+    import sentencepiece
+except ImportError:
+    ctranslate2 = None
+    sentencepiece = None
+
 
 class ArgosTranslator:
-    def __init__(self, from_code: str = "en", to_code: str = "zh", device_type: str = "cpu") -> None:
-        os.environ.setdefault("ARGOS_DEVICE_TYPE", device_type)
+    def __init__(
+        self,
+        from_code: str = "en",
+        to_code: str = "zh",
+        device_type: str = "cpu",
+        direct: bool = True,
+        compute_type: str = "auto",
+        beam_size: int = 4,
+        length_penalty: float = 0.2,
+        max_batch_size: int = 8,
+        inter_threads: int = 1,
+        intra_threads: int = 0,
+    ) -> None:
+        os.environ["ARGOS_DEVICE_TYPE"] = device_type
+        argostranslate.settings.device = device_type
         self._translator = None
         self._error = None
+        self._lock = threading.Lock()
+        self._device = device_type
+        self._compute_type = compute_type
+        self._beam_size = beam_size
+        self._length_penalty = length_penalty
+        self._max_batch_size = max_batch_size
+        self._inter_threads = max(1, inter_threads)
+        self._ct2 = None
+        self._sp = None
+        self._target_prefix = None
+        self._direct_error = None
 
         try:
             languages = argostranslate.translate.get_installed_languages()
@@ -19,17 +55,126 @@ class ArgosTranslator:
             self._translator = from_lang.get_translation(to_lang)
             if not self._translator:
                 self._error = "Argos translation pair not available."
+                return
         except Exception as exc:
             self._error = str(exc)
+            return
+
+        if direct:
+            try:
+                self._open_direct(from_code, to_code, intra_threads)
+            except Exception as exc:
+                self._ct2 = None
+                self._sp = None
+                self._direct_error = str(exc)
+
+    def _open_direct(self, from_code: str, to_code: str, intra_threads: int) -> None:
+        if ctranslate2 is None or sentencepiece is None:
+            raise ImportError("ctranslate2 and sentencepiece are required for direct mode")
+        package = next(
+            (
+                pkg
+                for pkg in argostranslate.package.get_installed_packages()
+                if pkg.from_code == from_code and pkg.to_code == to_code
+            ),
+            None,
+        )
+        if package is None:
+            raise FileNotFoundError(f"No direct Argos package for {from_code} -> {to_code}")
+        package_path = Path(package.package_path)
+        model_dir = package_path / "model"
+        sp_path = package_path / "sentencepiece.model"
+        if not model_dir.exists() or not sp_path.exists():
+            raise FileNotFoundError(f"Argos package has no CT2/SentencePiece model: {package_path}")
+
+        self._sp = sentencepiece.SentencePieceProcessor(model_file=str(sp_path))
+        self._ct2 = ctranslate2.Translator(
+            str(model_dir),
+            device=self._device,
+            compute_type=self._compute_type,
+            inter_threads=self._inter_threads,
+            intra_threads=intra_threads,
+        )
+        self._target_prefix = getattr(package, "target_prefix", "") or None
 
     @property
     def error(self):
         return self._error
 
+    @property
+    def mode(self) -> str:
+        return "direct" if self._ct2 else "api"
+
+    @property
+    def direct_error(self):
+        return self._direct_error
+
+    @property
+    def device(self):
+        return self._device
+
+    @property
+    def compute_type(self):
+        return self._compute_type
+
+    @property
+    def inter_threads(self):
+        return self._inter_threads if self._ct2 else 1
+
     def translate(self, text: str):
+        outputs, error = self.translate_many([text])
+        if error:
+            return None, error
+        return outputs[0], None
+
+    def translate_many(self, texts: list[str], timings: dict | None = None):
         if not self._translator:
             return None, self._error
+        if not texts:
+            return [], None
+        if self._ct2:
+            return self._translate_direct(texts, timings)
         try:
-            return self._translator.translate(text), None
+            started = time.perf_counter()
+            with self._lock:
+                outputs = [self._translator.translate(text) for text in texts]
+            if timings is not None:
+                timings["decode"] = timings.get("decode", 0.0) + time.perf_counter() - started
+            return outputs, None
         except Exception as exc:
             return None, str(exc)
+
+    def _translate_direct(self, texts: list[str], timings: dict | None):
+        try:
+            started = time.perf_counter()
+            with self._lock:
+                batch = self._sp.encode(texts, out_type=str)
+            tokenized = time.perf_counter()
+            target_prefix = (
+                [[self._target_prefix] for _ in batch] if self._target_prefix else None
+            )
+            results = self._ct2.translate_batch(
+                batch,
+                target_prefix=target_prefix,
+                beam_size=self._beam_size,
+                length_penalty=self._length_penalty,
+                max_batch_size=self._max_batch_size,
+                replace_unknowns=True,
+            )
+            decoded = time.perf_counter()
+            with self._lock:
+                outputs = [self._decode(result.hypotheses[0]) for result in results]
+            if timings is not None:
+                timings["tokenize"] = timings.get("tokenize", 0.0) + tokenized - started
+                timings["decode"] = timings.get("decode", 0.0) + decoded - tokenized
+                timings["detokenize"] = (
+                    timings.get("detokenize", 0.0) + time.perf_counter() - decoded
+                )
+            return outputs, None
+        except Exception as exc:
+            return None, str(exc)
+
+    def _decode(self, tokens: list[str]) -> str:
+        if self._target_prefix and tokens and tokens[0] == self._target_prefix:
+            tokens = tokens[1:]
+        return self._sp.decode(tokens)
@@ -12,6 +12,9 @@ class CT2CascadeTranslator:
         compute_type: str = "float32",
         beam_size: int = 1,
         max_batch_size: int = 1,
+        inter_threads: int = 1,
+        intra_threads: int = 0,
+        token_cache_size: int = 1024,
     ) -> None:
         self._first = CT2Translator(
             model_dir=first_model_dir,
@@ -20,6 +23,9 @@ class CT2CascadeTranslator:
             compute_type=compute_type,
             beam_size=beam_size,
             max_batch_size=max_batch_size,
+            inter_threads=inter_threads,
+            intra_threads=intra_threads,
+            token_cache_size=token_cache_size,
         )
         self._second = CT2Translator(
             model_dir=second_model_dir,
@@ -28,6 +34,9 @@ class CT2CascadeTranslator:
             compute_type=compute_type,
             beam_size=beam_size,
             max_batch_size=max_batch_size,
+            inter_threads=inter_threads,
+            intra_threads=intra_threads,
+            token_cache_size=token_cache_size,
         )
         self._error = self._first.error or self._second.error
         self._device = device
@@ -45,13 +54,26 @@ class CT2CascadeTranslator:
     def compute_type(self):
         return self._compute_type
 
+    @property
+    def inter_threads(self):
+        return self._first.inter_threads
+
+    def tokenizer_stats(self) -> dict:
+        return {"first": self._first.tokenizer_stats(), "second": self._second.tokenizer_stats()}
+
     def translate(self, text: str):
+        outputs, error = self.translate_many([text])
+        if error:
+            return None, error
+        return outputs[0], None
+
+    def translate_many(self, texts: list[str], timings: dict | None = None):
         if self._error:
             return None, self._error
-        mid, err = self._first.translate(text)
+        mids, err = self._first.translate_many(texts, timings=timings)
         if err:
             return None, f"stage1: {err}"
-        out, err = self._second.translate(mid)
+        outs, err = self._second.translate_many(mids, timings=timings)
         if err:
             return None, f"stage2: {err}"
-        return out, None
+        return outs, None
@@ -1,8 +1,10 @@
 from pathlib import Path
+import time
 
 import ctranslate2
-from transformers import AutoTokenizer
 
+from translate.streaming import stream_tokens
+from translate.tokenizer import load_tokenizer
 from utils.paths import resolve_path
 
 
@@ -17,6 +19,9 @@ class CT2NLLBTranslator:
         compute_type: str = "float32",
         beam_size: int = 1,
         max_batch_size: int = 1,
+        inter_threads: int = 1,
+        intra_threads: int = 0,
+        token_cache_size: int = 1024,
     ) -> None:
         self._translator = None
         self._tokenizer = None
@@ -27,6 +32,7 @@ class CT2NLLBTranslator:
         self._compute_type = compute_type
         self._beam_size = beam_size
         self._max_batch_size = max_batch_size
+        self._inter_threads = max(1, inter_threads)
         self._source_lang = source_lang
         self._target_lang = target_lang
         self._target_token = None
@@ -35,14 +41,21 @@ class CT2NLLBTranslator:
             model_path = self._resolve_dir(model_dir)
             tokenizer_path = self._resolve_dir(tokenizer_dir) if tokenizer_dir else model_path
 
-            self._tokenizer = self._load_tokenizer(str(tokenizer_path))
+            self._tokenizer = load_tokenizer(
+                tokenizer_path,
+                source_lang=source_lang,
+                model_dir=model_path,
+                cache_size=token_cache_size,
+            )
             self._validate_lang_code(source_lang, "source")
             self._validate_lang_code(target_lang, "target")
-            if hasattr(self._tokenizer, "src_lang"):
-                self._tokenizer.src_lang = source_lang
             self._target_token = target_lang
             self._translator = ctranslate2.Translator(
-                str(model_path), device=device, compute_type=compute_type
+                str(model_path),
+                device=device,
+                compute_type=compute_type,
+                inter_threads=self._inter_threads,
+                intra_threads=intra_threads,
             )
         except Exception as exc:
             self._error = str(exc)
@@ -67,42 +80,134 @@ class CT2NLLBTranslator:
     def compute_type(self):
         return self._compute_type
 
-    def _load_tokenizer(self, path: str):
-        try:
-            return AutoTokenizer.from_pretrained(path, use_fast=False)
-        except Exception:
-            try:
-                return AutoTokenizer.from_pretrained(
-                    path, use_fast=True, fix_mistral_regex=True
-                )
-            except TypeError:
-                return AutoTokenizer.from_pretrained(path, use_fast=True)
+    @property
+    def inter_threads(self):
+        return self._inter_threads
 
     def _validate_lang_code(self, lang_code: str, label: str) -> None:
-        token_id = self._tokenizer.convert_tokens_to_ids(lang_code)
-        unk_id = getattr(self._tokenizer, "unk_token_id", None)
-        if token_id is None or token_id == unk_id:
+        if not self._tokenizer.has_token(lang_code):
             raise ValueError(f"Unsupported {label}_lang: {lang_code}")
 
+    def tokenizer_stats(self) -> dict:
+        return self._tokenizer.stats() if self._tokenizer else {}
+
     def translate(self, text: str):
+        outputs, error = self.translate_many([text])
+        if error:
+            return None, error
+        return outputs[0], None
+
+    def translate_many(self, texts: list[str], timings: dict | None = None):
         if not self._translator or not self._tokenizer:
             return None, self._error
+        if not texts:
+            return [], None
         try:
-            if hasattr(self._tokenizer, "src_lang"):
-                self._tokenizer.src_lang = self._source_lang
-            tokens = self._tokenizer.convert_ids_to_tokens(
-                self._tokenizer.encode(text, add_special_tokens=True)
+            started = time.perf_counter()
+            batch = self._tokenizer.encode_batch(texts)
+            tokenized = time.perf_counter()
+            target_prefix = (
+                [[self._target_token] for _ in batch] if self._target_token else None
             )
-            target_prefix = [[self._target_token]] if self._target_token else None
             results = self._translator.translate_batch(
-                [tokens],
+                batch,
                 target_prefix=target_prefix,
                 beam_size=self._beam_size,
                 max_batch_size=self._max_batch_size,
             )
-            out_tokens = results[0].hypotheses[0]
-            out_ids = self._tokenizer.convert_tokens_to_ids(out_tokens)
-            out_text = self._tokenizer.decode(out_ids, skip_special_tokens=True)
-            return out_text, None
+            decoded = time.perf_counter()
+            outputs = [self._decode(result.hypotheses[0]) for result in results]
+            if timings is not None:
+                timings["tokenize"] = timings.get("tokenize", 0.0) + tokenized - started
+                timings["decode"] = timings.get("decode", 0.0) + decoded - tokenized
+                timings["detokenize"] = (
+                    timings.get("detokenize", 0.0) + time.perf_counter() - decoded
+                )
+            return outputs, None
+        except Exception as exc:
+            return None, str(exc)
+
+    def translate_stream(
+        self,
+        text: str,
+        on_partial=None,
+        should_stop=None,
+        timings: dict | None = None,
+        emit_every: int = 4,
+        target_prefix: list[str] | None = None,
+    ):
+        tokens, error = self.translate_tokens(
+            text,
+            target_prefix=target_prefix,
+            on_partial=on_partial,
+            should_stop=should_stop,
+            timings=timings,
+            emit_every=emit_every,
+        )
+        if tokens is None:
+            return None, error
+        try:
+            started = time.perf_counter()
+            output = self._decode(tokens)
+            if timings is not None:
+                timings["detokenize"] = (
+                    timings.get("detokenize", 0.0) + time.perf_counter() - started
+                )
+            return output, None
         except Exception as exc:
             return None, str(exc)
+
+    def translate_tokens(
+        self,
+        text: str,
+        target_prefix: list[str] | None = None,
+        on_partial=None,
+        should_stop=None,
+        timings: dict | None = None,
+        emit_every: int = 4,
+    ):
+        if not self._translator or not self._tokenizer:
+            return None, self._error
+        try:
+            started = time.perf_counter()
+            source = self._encode(text)
+            tokenized = time.perf_counter()
+            prefix = list(target_prefix or [])
+            forced = [self._target_token] + prefix if self._target_token else prefix
+            if self._beam_size > 1:
+                results = self._translator.translate_batch(
+                    [source],
+                    target_prefix=[forced] if forced else None,
+                    beam_size=self._beam_size,
+                    max_batch_size=self._max_batch_size,
+                )
+                tokens = list(results[0].hypotheses[0])
+            else:
+                tokens = stream_tokens(
+                    self._translator,
+                    source,
+                    self._decode,
+                    on_partial=on_partial,
+                    should_stop=should_stop,
+                    target_prefix=forced or None,
+                    emit_every=emit_every,
+                )
+            if tokens and self._target_token and tokens[0] == self._target_token:
+                tokens = tokens[1:]
+            if timings is not None:
+                timings["tokenize"] = timings.get("tokenize", 0.0) + tokenized - started
+                timings["decode"] = (
+                    timings.get("decode", 0.0) + time.perf_counter() - tokenized
+                )
+            return tokens, None
+        except Exception as exc:
+            return None, str(exc)
+
+    def detokenize(self, tokens: list[str]) -> str:
+        return self._decode(tokens)
+
+    def _encode(self, text: str) -> list[str]:
+        return self._tokenizer.encode(text)
+
+    def _decode(self, tokens: list[str]) -> str:
+        return self._tokenizer.decode(tokens)
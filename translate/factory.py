@@ -0,0 +1,108 @@
+import importlib
+
+
+_ENGINES = {
+    "argos": ("translate.argos_engine", "ArgosTranslator"),
+    "ct2": ("translate.ct2_engine", "CT2Translator"),
+    "ct2_cascade": ("translate.ct2_cascade", "CT2CascadeTranslator"),
+    "ct2_nllb": ("translate.ct2_nllb", "CT2NLLBTranslator"),
+}
+
+ENGINE_LABELS = {
+    "argos": "Argos",
+    "ct2": "CT2",
+    "ct2_cascade": "CT2 cascade",
+    "ct2_nllb": "CT2 NLLB",
+}
+
+
+class UnavailableTranslator:
+    def __init__(self, error: str) -> None:
+        self._error = error
+
+    @property
+    def error(self):
+        return self._error
+
+    def translate(self, text: str):
+        return None, self._error
+
+    def translate_many(self, texts: list[str], timings: dict | None = None):
+        return None, self._error
+
+
+def engine_name(translate_cfg: dict) -> str:
+    name = translate_cfg.get("engine", "argos")
+    return name if name in _ENGINES else "argos"
+
+
+def translator_kwargs(translate_cfg: dict) -> dict:
+    name = engine_name(translate_cfg)
+    if name == "argos":
+        argos_cfg = translate_cfg.get("argos", {})
+        return {
+            "from_code": translate_cfg.get("from", "en"),
+            "to_code": translate_cfg.get("to", "zh"),
+            "device_type": translate_cfg.get("argos_device_type", "cpu"),
+            "direct": argos_cfg.get("direct", True),
+            "compute_type": argos_cfg.get("compute_type", "auto"),
+            "beam_size": argos_cfg.get("beam_size", 4),
+            "length_penalty": argos_cfg.get("length_penalty", 0.2),
+            "max_batch_size": argos_cfg.get("max_batch_size", 8),
+            "inter_threads": argos_cfg.get("inter_threads", 1),
+            "intra_threads": argos_cfg.get("intra_threads", 0),
+        }
+
+    engine_cfg = translate_cfg.get(name, {})
+    kwargs = {
+        "device": engine_cfg.get("device", "cpu"),
+        "compute_type": engine_cfg.get("compute_type", "float32"),
+        "beam_size": engine_cfg.get("beam_size", 1),
+        "max_batch_size": engine_cfg.get("max_batch_size", 1),
+        "inter_threads": engine_cfg.get("inter_threads", 1),
+        "intra_threads": engine_cfg.get("intra_threads", 0),
+        "token_cache_size": engine_cfg.get("token_cache_size", 1024),
+    }
+    if name == "ct2_cascade":
+        kwargs.update(
+            first_model_dir=engine_cfg.get("first_model_dir", ""),
+            second_model_dir=engine_cfg.get("second_model_dir", ""),
+            first_tokenizer_dir=engine_cfg.get("first_tokenizer_dir"),
+            second_tokenizer_dir=engine_cfg.get("second_tokenizer_dir"),
+        )
+    else:
+        kwargs.update(
+            model_dir=engine_cfg.get("model_dir", ""),
+            tokenizer_dir=engine_cfg.get("tokenizer_dir"),
+        )
+    if name == "ct2_nllb":
+        lang_cfg = translate_cfg.get("nllb", {})
+        kwargs.update(
+            source_lang=lang_cfg.get("source_lang", "jpn_Jpan"),
+            target_lang=lang_cfg.get("target_lang", "zho_Hans"),
+        )
+    return kwargs
+
+
+def create_translator(translate_cfg: dict, cpu_fallback: bool = False):
+    name = engine_name(translate_cfg)
+    module_name, class_name = _ENGINES[name]
+    kwargs = translator_kwargs(translate_cfg)
+    if cpu_fallback:
+        device_key = "device_type" if name == "argos" else "device"
+        kwargs.update({device_key: "cpu", "compute_type": "int8"})
+    try:
+        engine_cls = getattr(importlib.import_module(module_name), class_name)
+    except ImportError as exc:
+        return UnavailableTranslator(f"{ENGINE_LABELS[name]} unavailable: {exc}")
+    return engine_cls(**kwargs)
+
+
+def uses_gpu(translator) -> bool:
+    return getattr(translator, "device", None) in ("cuda", "gpu")
+
+
+def warmup_translator(translator, text: str = "Hello.") -> None:
+    if translator.error:
+        return
+    translator.translate_many([text])
@@ -0,0 +1,27 @@
+class PrefixTracker:
+    def __init__(self, rollback_tokens: int = 2, min_prefix_tokens: int = 2) -> None:
+        self._rollback = max(0, int(rollback_tokens))
+        self._min_prefix = max(1, int(min_prefix_tokens))
+        self._last = ("", [])
+
+    def prefix_for(self, text: str) -> list[str] | None:
+        prev, tokens = self._last
+        if not prev or len(text) <= len(prev) or not text.startswith(prev):
+            return None
+        if not self._at_boundary(prev, text[len(prev)]):
+            return None
+        keep = len(tokens) - self._rollback
+        if keep < self._min_prefix:
+            return None
+        return tokens[:keep]
+
+    def update(self, text: str, tokens: list[str]) -> None:
+        self._last = (text, list(tokens))
+
+    def reset(self) -> None:
+        self._last = ("", [])
+
+    @staticmethod
+    def _at_boundary(prev: str, next_char: str) -> bool:
+        last = prev[-1]
+        return next_char.isspace() or not last.isalnum() or not last.isascii()
@@ -0,0 +1,26 @@
+def stream_tokens(
+    translator,
+    source: list[str],
+    decode,
+    on_partial=None,
+    should_stop=None,
+    target_prefix: list[str] | None = None,
+    emit_every: int = 4,
+    max_decoding_length: int = 256,
+):
+    tokens = []
+    steps = translator.generate_tokens(
+        source, target_prefix=target_prefix, max_decoding_length=max_decoding_length
+    )
+    try:
+        for step in steps:
+            if should_stop and should_stop():
+                return None
+            tokens.append(step.token)
+            if on_partial and not step.is_last and len(tokens) % max(1, emit_every) == 0:
+                on_partial(decode(tokens))
+    finally:
+        close = getattr(steps, "close", None)
+        if close:
+            close()
+    return tokens
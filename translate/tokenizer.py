@@ -0,0 +1,183 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+import json
+import re
+import threading
+
+from utils.cache import LRUCache
+
+try:
+    import sentencepiece
+except ImportError:
+    sentencepiece = None
+
+
+_NLLB_LANG = re.compile(r"^[a-z]{3}_[A-Z][a-z]{3}$")
+_SPECIAL = frozenset(("<s>", "</s>", "<pad>", "<unk>"))
+
+
+class CachedTokenizer(ABC):
+    kind = ""
+
+    def __init__(self, cache_size: int = 1024) -> None:
+        self._cache = LRUCache(cache_size) if cache_size > 0 else None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def encode(self, text: str) -> list[str]:
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts: list[str]) -> list[list[str]]:
+        results = [None] * len(texts)
+        missing = []
+        for index, text in enumerate(texts):
+            cached = self._cache.get(text) if self._cache is not None else None
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = list(cached)
+        with self._lock:
+            self._hits += len(texts) - len(missing)
+            self._misses += len(missing)
+            if not missing:
+                return results
+            encoded = self._encode_batch([texts[index] for index in missing])
+        for index, tokens in zip(missing, encoded):
+            results[index] = tokens
+            if self._cache is not None:
+                self._cache.set(texts[index], tuple(tokens))
+        return results
+
+    def decode(self, tokens: list[str]) -> str:
+        with self._lock:
+            return self._decode(tokens)
+
+    def has_token(self, token: str) -> bool:
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "tokenizer": self.kind,
+            "token_cache_entries": len(self._cache) if self._cache is not None else 0,
+            "token_cache_hits": self._hits,
+            "token_cache_misses": self._misses,
+        }
+
+    @abstractmethod
+    def _encode_batch(self, texts: list[str]) -> list[list[str]]:
+        ...
+
+    @abstractmethod
+    def _decode(self, tokens: list[str]) -> str:
+        ...
+
+
+class NLLBSentencePieceTokenizer(CachedTokenizer):
+    kind = "sentencepiece"
+
+    def __init__(
+        self, model_file, source_lang: str, vocabulary=None, cache_size: int = 1024
+    ) -> None:
+        super().__init__(cache_size)
+        self._sp = sentencepiece.SentencePieceProcessor(model_file=str(model_file))
+        self._source_lang = source_lang
+        self._vocabulary = vocabulary
+
+    def has_token(self, token: str) -> bool:
+        if self._vocabulary is not None:
+            return token in self._vocabulary
+        return bool(_NLLB_LANG.match(token))
+
+    def _encode_batch(self, texts: list[str]) -> list[list[str]]:
+        pieces = self._sp.encode(texts, out_type=str)
+        return [[self._source_lang] + tokens + ["</s>"] for tokens in pieces]
+
+    def _decode(self, tokens: list[str]) -> str:
+        return self._sp.decode(
+            [token for token in tokens if token not in _SPECIAL and not _NLLB_LANG.match(token)]
+        )
+
+
+class MarianSentencePieceTokenizer(CachedTokenizer):
+    kind = "sentencepiece"
+
+    def __init__(self, source_file, target_file, cache_size: int = 1024) -> None:
+        super().__init__(cache_size)
+        self._source = sentencepiece.SentencePieceProcessor(model_file=str(source_file))
+        self._target = sentencepiece.SentencePieceProcessor(model_file=str(target_file))
+
+    def _encode_batch(self, texts: list[str]) -> list[list[str]]:
+        return [tokens + ["</s>"] for tokens in self._source.encode(texts, out_type=str)]
+
+    def _decode(self, tokens: list[str]) -> str:
+        return self._target.decode([token for token in tokens if token not in _SPECIAL])
+
+
+class HFTokenizer(CachedTokenizer):
+    def __init__(self, tokenizer, source_lang: str | None = None, cache_size: int = 1024) -> None:
+        super().__init__(cache_size)
+        self._tokenizer = tokenizer
+        self.kind = "hf_fast" if getattr(tokenizer, "is_fast", False) else "hf"
+        if source_lang and hasattr(tokenizer, "src_lang"):
+            tokenizer.src_lang = source_lang
+
+    def has_token(self, token: str) -> bool:
+        token_id = self._tokenizer.convert_tokens_to_ids(token)
+        return token_id is not None and token_id != getattr(self._tokenizer, "unk_token_id", None)
+
+    def _encode_batch(self, texts: list[str]) -> list[list[str]]:
+        encoded = self._tokenizer(texts, add_special_tokens=True)["input_ids"]
+        return [self._tokenizer.convert_ids_to_tokens(ids) for ids in encoded]
+
+    def _decode(self, tokens: list[str]) -> str:
+        out_ids = self._tokenizer.convert_tokens_to_ids(tokens)
+        return self._tokenizer.decode(out_ids, skip_special_tokens=True)
+
+
+def load_tokenizer(
+    tokenizer_dir,
+    source_lang: str | None = None,
+    model_dir=None,
+    cache_size: int = 1024,
+) -> CachedTokenizer:
+    path = Path(tokenizer_dir)
+    if sentencepiece is not None:
+        if source_lang and (path / "sentencepiece.bpe.model").exists():
+            return NLLBSentencePieceTokenizer(
+                path / "sentencepiece.bpe.model",
+                source_lang,
+                vocabulary=_load_vocabulary(model_dir),
+                cache_size=cache_size,
+            )
+        if not source_lang and (path / "source.spm").exists() and (path / "target.spm").exists():
+            return MarianSentencePieceTokenizer(
+                path / "source.spm", path / "target.spm", cache_size=cache_size
+            )
+    return HFTokenizer(_load_hf_tokenizer(str(path)), source_lang, cache_size=cache_size)
+
+
+def _load_hf_tokenizer(path: str):
+    try:
+        from transformers import AutoTokenizer
+    except ImportError as exc:
+        raise ImportError(
+            "Tokenizer needs sentencepiece model files or the transformers package"
+        ) from exc
+    try:
+        return AutoTokenizer.from_pretrained(path, use_fast=True)
+    except Exception:
+        return AutoTokenizer.from_pretrained(path, use_fast=False)
+
+
+def _load_vocabulary(model_dir):
+    if model_dir is None:
+        return None
+    model_path = Path(model_dir)
+    json_path = model_path / "shared_vocabulary.json"
+    if json_path.exists():
+        return frozenset(json.loads(json_path.read_text(encoding="utf-8")))
+    text_path = model_path / "shared_vocabulary.txt"
+    if text_path.exists():
+        return frozenset(text_path.read_text(encoding="utf-8").splitlines())
+    return None
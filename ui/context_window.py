@@ -2,7 +2,7 @@ from collections import deque
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from utils.text import similarity
+from utils.similarity import similarity_at_least
 
 
 class ContextWindow(QtWidgets.QWidget):
@@ -60,7 +60,7 @@ class ContextWindow(QtWidgets.QWidget):
 
         if self._entries:
             last_original, _last_translation = self._entries[-1]
-            if similarity(original, last_original) >= self._update_similarity:
+            if similarity_at_least(original, last_original, self._update_similarity):
                 self._entries[-1] = (original, translation)
                 self._refresh()
                 return
@@ -0,0 +1,17 @@
+import numpy as np
+
+
+class BufferPool:
+    def __init__(self) -> None:
+        self._buffers = {}
+
+    def get(self, name: str, shape, dtype=np.uint8):
+        shape = tuple(shape)
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._buffers[name] = buf
+        return buf
+
+    def clear(self) -> None:
+        self._buffers.clear()
@@ -1,19 +1,334 @@
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
 from collections import OrderedDict
+from pathlib import Path
+
+from utils.fuzzy_index import FuzzyIndex
+from utils.text import normalize_text
 
 
 class LRUCache:
     def __init__(self, max_entries: int = 1024) -> None:
         self._max_entries = max_entries
         self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
 
     def get(self, key):
-        if key not in self._data:
-            return None
-        self._data.move_to_end(key)
-        return self._data[key]
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
 
     def set(self, key, value) -> None:
-        self._data[key] = value
-        self._data.move_to_end(key)
-        if len(self._data) > self._max_entries:
-            self._data.popitem(last=False)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def cache_key(text: str) -> str:
+    return normalize_text(unicodedata.normalize("NFKC", text))
+
+
+class PersistentCache:
+    def __init__(self, path, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "namespace TEXT NOT NULL, source TEXT NOT NULL, target TEXT NOT NULL, "
+            "size INTEGER NOT NULL, last_used REAL NOT NULL, "
+            "PRIMARY KEY (namespace, source))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used)"
+        )
+        self._conn.commit()
+        row = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM translations"
+        ).fetchone()
+        self._entries = row[0]
+        self._bytes = row[1]
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(self, namespace: str, source: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT target FROM translations WHERE namespace = ? AND source = ?",
+                (namespace, source),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._conn.execute(
+                "UPDATE translations SET last_used = ? WHERE namespace = ? AND source = ?",
+                (time.time(), namespace, source),
+            )
+            self._conn.commit()
+            return row[0]
+
+    def set(self, namespace: str, source: str, target: str) -> None:
+        with self._lock:
+            self._put(namespace, source, target, time.time())
+            self._conn.commit()
+            self._evict()
+
+    def keys(self, namespace: str, limit: int = 0) -> list[str]:
+        query = "SELECT source FROM translations WHERE namespace = ? ORDER BY last_used DESC"
+        params = (namespace,)
+        if limit > 0:
+            query += " LIMIT ?"
+            params = (namespace, limit)
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params)]
+
+    def clear(self, namespace: str | None = None) -> int:
+        with self._lock:
+            if namespace is None:
+                cursor = self._conn.execute("DELETE FROM translations")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM translations WHERE namespace = ?", (namespace,)
+                )
+            self._conn.commit()
+            self._refresh_totals()
+            return cursor.rowcount
+
+    def export(self, path, namespace: str | None = None) -> int:
+        query = "SELECT namespace, source, target, last_used FROM translations"
+        params = ()
+        if namespace is not None:
+            query += " WHERE namespace = ?"
+            params = (namespace,)
+        count = 0
+        with self._lock, open(path, "w", encoding="utf-8") as handle:
+            for ns, source, target, last_used in self._conn.execute(query, params):
+                record = {
+                    "namespace": ns,
+                    "source": source,
+                    "target": target,
+                    "last_used": last_used,
+                }
+                handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def import_file(self, path) -> int:
+        count = 0
+        with self._lock, open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                self._put(
+                    record["namespace"],
+                    record["source"],
+                    record["target"],
+                    float(record.get("last_used", time.time())),
+                )
+                count += 1
+            self._conn.commit()
+            self._evict()
+        return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "path": str(self._path),
+                "entries": self._entries,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _put(self, namespace: str, source: str, target: str, last_used: float) -> None:
+        size = len(source.encode("utf-8")) + len(target.encode("utf-8"))
+        row = self._conn.execute(
+            "SELECT size FROM translations WHERE namespace = ? AND source = ?",
+            (namespace, source),
+        ).fetchone()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO translations (namespace, source, target, size, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (namespace, source, target, size, last_used),
+        )
+        if row is None:
+            self._entries += 1
+            self._bytes += size
+        else:
+            self._bytes += size - row[0]
+
+    def _evict(self) -> None:
+        if self._max_bytes <= 0 or self._bytes <= self._max_bytes:
+            return
+        target_bytes = int(self._max_bytes * 0.9)
+        while self._bytes > target_bytes:
+            rows = self._conn.execute(
+                "SELECT namespace, source, size FROM translations "
+                "ORDER BY last_used ASC LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            doomed = []
+            for namespace, source, size in rows:
+                if self._bytes <= target_bytes:
+                    break
+                doomed.append((namespace, source))
+                self._bytes -= size
+                self._entries -= 1
+            self._conn.executemany(
+                "DELETE FROM translations WHERE namespace = ? AND source = ?", doomed
+            )
+            self._evictions += len(doomed)
+        self._conn.commit()
+
+    def _refresh_totals(self) -> None:
+        row = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM translations"
+        ).fetchone()
+        self._entries = row[0]
+        self._bytes = row[1]
+
+
+class TranslationCache:
+    def __init__(
+        self,
+        memory: LRUCache,
+        store: PersistentCache | None = None,
+        fuzzy: FuzzyIndex | None = None,
+    ) -> None:
+        self._memory = memory
+        self._store = store
+        self._fuzzy = fuzzy
+        self._lock = threading.RLock()
+        self._namespace = ""
+        self._generation = 0
+        self._memory_hits = 0
+        self._store_hits = 0
+        self._fuzzy_hits = 0
+        self._misses = 0
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    def set_namespace(self, namespace: str) -> None:
+        with self._lock:
+            if namespace == self._namespace:
+                return
+            self._memory.clear()
+            self._namespace = namespace
+            self._generation += 1
+            if self._fuzzy is None:
+                return
+            self._fuzzy.clear()
+            if not self._store:
+                return
+            generation = self._generation
+        threading.Thread(
+            target=self._fill_fuzzy, args=(namespace, generation), name="fuzzy-fill", daemon=True
+        ).start()
+
+    def _fill_fuzzy(self, namespace: str, generation: int) -> None:
+        for key in reversed(self._store.keys(namespace, limit=self._fuzzy_limit())):
+            if generation != self._generation:
+                return
+            self._fuzzy.add(key)
+
+    def get(self, text: str):
+        with self._lock:
+            return self._get(text)
+
+    def _get(self, text: str):
+        key = cache_key(text)
+        value = self._lookup(key)
+        if value is not None:
+            return value
+        if self._fuzzy is not None:
+            match = self._fuzzy.find(key)
+            if match is not None:
+                value = self._memory.get(match)
+                if value is None and self._store:
+                    value = self._store.get(self._namespace, match)
+                if value is not None:
+                    self._fuzzy_hits += 1
+                    self._memory.set(key, value)
+                    return value
+                self._fuzzy.remove(match)
+        self._misses += 1
+        return None
+
+    def set(self, text: str, value: str) -> None:
+        key = cache_key(text)
+        with self._lock:
+            self._memory.set(key, value)
+            if self._store:
+                self._store.set(self._namespace, key, value)
+            if self._fuzzy is not None:
+                self._fuzzy.add(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> dict:
+        stats = {
+            "namespace": self._namespace,
+            "memory_entries": len(self._memory),
+            "memory_hits": self._memory_hits,
+            "store_hits": self._store_hits,
+            "fuzzy_hits": self._fuzzy_hits,
+            "misses": self._misses,
+        }
+        if self._fuzzy is not None:
+            stats["fuzzy_entries"] = len(self._fuzzy)
+        if self._store:
+            stats["store"] = self._store.stats()
+        return stats
+
+    def _lookup(self, key: str):
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory_hits += 1
+            return value
+        if self._store:
+            value = self._store.get(self._namespace, key)
+            if value is not None:
+                self._store_hits += 1
+                self._memory.set(key, value)
+                return value
+        return None
+
+    def _fuzzy_limit(self) -> int:
+        return self._fuzzy.max_entries if self._fuzzy is not None else 0
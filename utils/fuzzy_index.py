@@ -0,0 +1,146 @@
+import random
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+from utils.similarity import levenshtein
+
+
+_MASK32 = 0xFFFFFFFF
+
+
+def _ngrams(text: str, n: int) -> list[str]:
+    if len(text) < n:
+        return [text] if text else []
+    return [text[i : i + n] for i in range(len(text) - n + 1)]
+
+
+class FuzzyIndex:
+    def __init__(
+        self,
+        min_similarity: float = 0.9,
+        ngram: int = 2,
+        max_entries: int = 50000,
+        min_chars: int = 8,
+        latin_ngram: int = 4,
+        bands: int = 16,
+        rows: int = 4,
+        max_candidates: int = 32,
+    ) -> None:
+        self._min_similarity = min_similarity
+        self._n = max(1, ngram)
+        self._latin_n = max(1, latin_ngram)
+        self._max_entries = max_entries
+        self._min_chars = min_chars
+        self._bands = max(1, bands)
+        self._rows = max(1, rows)
+        self._max_candidates = max(1, max_candidates)
+        rng = random.Random(0x5EED)
+        count = self._bands * self._rows
+        self._mul = np.array(
+            [rng.getrandbits(64) | 1 for _ in range(count)], dtype=np.uint64
+        )[:, None]
+        self._add = np.array([rng.getrandbits(64) for _ in range(count)], dtype=np.uint64)[
+            :, None
+        ]
+        self._entries = OrderedDict()
+        self._buckets = {}
+        self._next_id = 0
+        self._texts = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    def add(self, text: str) -> None:
+        if len(text) < self._min_chars:
+            return
+        keys = self._band_keys(text)
+        with self._lock:
+            if text in self._entries:
+                self._entries.move_to_end(text)
+                return
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[text] = entry_id
+            self._texts[entry_id] = text
+            for key in keys:
+                self._buckets.setdefault(key, set()).add(entry_id)
+            while len(self._entries) > self._max_entries:
+                old_text = next(iter(self._entries))
+                self._remove(old_text, self._band_keys(old_text))
+
+    def remove(self, text: str) -> None:
+        keys = self._band_keys(text)
+        with self._lock:
+            self._remove(text, keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self._texts.clear()
+
+    def find(self, text: str):
+        length = len(text)
+        if length < self._min_chars:
+            return None
+        keys = self._band_keys(text)
+
+        with self._lock:
+            votes = Counter()
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket:
+                    votes.update(bucket)
+            best = None
+            best_score = self._min_similarity
+            for entry_id, _count in votes.most_common(self._max_candidates):
+                other = self._texts[entry_id]
+                longest = max(length, len(other))
+                allowed = int((1.0 - best_score) * longest + 1e-9)
+                if abs(len(other) - length) > allowed:
+                    continue
+                dist = levenshtein(text, other, allowed)
+                if dist > allowed:
+                    continue
+                score = 1.0 - dist / longest
+                if best is None or score > best_score:
+                    best = other
+                    best_score = score
+            if best is not None:
+                self._entries.move_to_end(best)
+            return best
+
+    def _band_keys(self, text: str) -> list[tuple]:
+        latin = sum(ch.isascii() for ch in text) * 2 > len(text)
+        grams = set(_ngrams(text, self._latin_n if latin else self._n))
+        if not grams:
+            return []
+        hashes = np.fromiter(
+            (hash(gram) & _MASK32 for gram in grams), dtype=np.uint64, count=len(grams)
+        )
+        signature = ((self._mul * hashes + self._add) >> np.uint64(32)).min(axis=1)
+        rows = self._rows
+        return [
+            (band, signature[band * rows : (band + 1) * rows].tobytes())
+            for band in range(self._bands)
+        ]
+
+    def _remove(self, text: str, keys: list[tuple]) -> None:
+        entry_id = self._entries.pop(text, None)
+        if entry_id is None:
+            return
+        self._texts.pop(entry_id, None)
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._buckets[key]
@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+
+class RollingHistogram:
+    def __init__(self, window: int = 2048) -> None:
+        self._samples = deque(maxlen=window)
+        self._count = 0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self._count += 1
+
+    def snapshot(self) -> dict:
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": self._count}
+        return {
+            "count": self._count,
+            "p50_ms": round(self._percentile(samples, 0.50) * 1000.0, 3),
+            "p95_ms": round(self._percentile(samples, 0.95) * 1000.0, 3),
+            "p99_ms": round(self._percentile(samples, 0.99) * 1000.0, 3),
+            "max_ms": round(samples[-1] * 1000.0, 3),
+            "mean_ms": round(sum(samples) / len(samples) * 1000.0, 3),
+        }
+
+    def _percentile(self, samples: list[float], q: float) -> float:
+        index = min(len(samples) - 1, max(0, int(round(q * (len(samples) - 1)))))
+        return samples[index]
+
+
+class TextTrace:
+    __slots__ = ("_metrics", "start", "last")
+
+    def __init__(self, metrics, start: float | None = None) -> None:
+        self._metrics = metrics
+        self.start = time.monotonic() if start is None else start
+        self.last = self.start
+
+    def copy(self) -> "TextTrace":
+        trace = TextTrace(self._metrics, self.start)
+        trace.last = self.last
+        return trace
+
+    def mark(self, stage: str, now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        seconds = max(0.0, now - self.last)
+        self.last = now
+        self._metrics.record(stage, seconds)
+        return seconds
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.last += seconds
+        self._metrics.record(stage, seconds)
+
+    def finish(self, now: float | None = None) -> float:
+        now = time.monotonic() if now is None else now
+        seconds = max(0.0, now - self.start)
+        self._metrics.record("total", seconds)
+        return seconds
+
+
+class PipelineMetrics:
+    def __init__(self, window: int = 2048, enabled: bool = True) -> None:
+        self._window = window
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._counters = {}
+        self._gauges = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def record(self, stage: str, seconds: float) -> None:
+        if not self._enabled:
+            return
+        with self._lock:
+            hist = self._stages.get(stage)
+            if hist is None:
+                hist = RollingHistogram(self._window)
+                self._stages[stage] = hist
+            hist.add(seconds)
+
+    def trace(self, start: float | None = None) -> TextTrace:
+        return TextTrace(self, start)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "stages": {name: hist.snapshot() for name, hist in self._stages.items()},
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+            }
+
+    def dump_json(self, path, extra: dict | None = None) -> None:
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
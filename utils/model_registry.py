@@ -0,0 +1,114 @@
+import gc
+import json
+import threading
+from collections import OrderedDict
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _freeze(config) -> str:
+    return json.dumps(config, sort_keys=True, default=str)
+
+
+class ModelRegistry:
+    def __init__(self, min_free_mb: int = 0) -> None:
+        self._min_free_mb = min_free_mb
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._loads = 0
+        self._evictions = 0
+
+    def configure(self, min_free_mb: int) -> None:
+        with self._lock:
+            self._min_free_mb = min_free_mb
+            self._enforce_limits(keep=None)
+
+    def get(self, kind: str, config, factory):
+        key = (kind, _freeze(config))
+        while True:
+            with self._lock:
+                model = self._entries.get(key)
+                if model is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return model
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = threading.Event()
+                    self._loading[key] = loading
+                    break
+            loading.wait()
+
+        model = None
+        try:
+            model = factory()
+        finally:
+            with self._lock:
+                del self._loading[key]
+                if model is not None:
+                    self._loads += 1
+                    if not getattr(model, "error", None):
+                        self._store(key, model)
+            loading.set()
+        return model
+
+    def put(self, kind: str, config, model) -> None:
+        with self._lock:
+            self._store((kind, _freeze(config)), model)
+
+    def release(self, kind: str | None = None) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if kind is None or key[0] == kind]:
+                self._drop(key)
+        gc.collect()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "models": [key[0] for key in self._entries],
+                "model_hits": self._hits,
+                "model_loads": self._loads,
+                "model_evictions": self._evictions,
+            }
+
+    def _store(self, key, model) -> None:
+        stale = [other for other in self._entries if other[0] == key[0] and other != key]
+        for other in stale:
+            self._drop(other)
+        self._entries[key] = model
+        self._entries.move_to_end(key)
+        self._enforce_limits(keep=key)
+        if stale:
+            gc.collect()
+
+    def _enforce_limits(self, keep) -> None:
+        while self._entries and self._low_memory():
+            victim = next((key for key in self._entries if key != keep), None)
+            if victim is None:
+                break
+            self._drop(victim)
+            gc.collect()
+
+    def _drop(self, key) -> None:
+        model = self._entries.pop(key)
+        self._evictions += 1
+        close = getattr(model, "close", None)
+        if close:
+            close()
+
+    def _low_memory(self) -> bool:
+        if not self._min_free_mb or psutil is None:
+            return False
+        return psutil.virtual_memory().available < self._min_free_mb * 1024 * 1024
+
+
+_REGISTRY = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    return _REGISTRY
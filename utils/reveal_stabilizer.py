@@ -0,0 +1,89 @@
+from utils.similarity import similarity_at_least
+
+
+class RevealStabilizer:
+    def __init__(
+        self,
+        quiet_ms: int = 300,
+        max_hold_ms: int = 3000,
+        end_punct: str = ".!?…",
+        prefix_similarity: float = 0.9,
+    ) -> None:
+        self._quiet = quiet_ms / 1000.0
+        self._max_hold = max_hold_ms / 1000.0 if max_hold_ms > 0 else 0.0
+        self._end_punct = frozenset(end_punct)
+        self._tail_chars = frozenset("\"')\\]」』】》）")
+        self._prefix_similarity = prefix_similarity
+        self._held = ""
+        self._released = ""
+        self._held_since = 0.0
+        self._last_growth = 0.0
+        self._saved = 0
+
+    @property
+    def saved(self) -> int:
+        return self._saved
+
+    @property
+    def pending(self) -> str:
+        return self._held
+
+    def update(self, text: str, now: float) -> list[str]:
+        released = []
+        held = self._held or self._released
+        if held and self._is_growth(held, text):
+            if self._held:
+                self._saved += 1
+            else:
+                self._held_since = now
+            self._held = text
+            self._last_growth = now
+        elif held and (text == held or held.startswith(text)):
+            return self.flush_if_quiet(now)
+        else:
+            released.extend(self.flush())
+            self._held = text
+            self._held_since = now
+            self._last_growth = now
+
+        if self._is_complete(self._held):
+            released.extend(self.flush())
+        else:
+            released.extend(self.flush_if_quiet(now))
+        return released
+
+    def flush_if_quiet(self, now: float) -> list[str]:
+        if not self._held:
+            return []
+        if now - self._last_growth >= self._quiet:
+            return self.flush()
+        if self._max_hold and now - self._held_since >= self._max_hold:
+            return self.flush()
+        return []
+
+    def flush(self) -> list[str]:
+        if not self._held:
+            return []
+        text = self._held
+        self._released = text
+        self._held = ""
+        return [text]
+
+    def clear(self) -> None:
+        self._held = ""
+        self._released = ""
+
+    def _is_growth(self, held: str, text: str) -> bool:
+        if len(text) <= len(held):
+            return False
+        if text.startswith(held):
+            return True
+        return similarity_at_least(text[: len(held)], held, self._prefix_similarity)
+
+    def _is_complete(self, text: str) -> bool:
+        for ch in reversed(text):
+            if ch in self._end_punct:
+                return True
+            if ch not in self._tail_chars:
+                return False
+        return False
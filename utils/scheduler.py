@@ -0,0 +1,169 @@
+import threading
+import time
+from collections import deque
+
+
+class AdaptiveRate:
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        backoff: float = 2.0,
+        idle_after: float = 2.0,
+    ) -> None:
+        self._min_interval = max(0.0, min_interval)
+        self._max_interval = max(self._min_interval, max_interval)
+        self._backoff = max(1.0, backoff)
+        self._idle_after = max(0.0, idle_after)
+        self._interval = self._min_interval
+        self._last_change = None
+        self._idle = False
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def idle(self) -> bool:
+        return self._idle
+
+    @property
+    def rate_hz(self) -> float:
+        return 1.0 / self._interval if self._interval > 0 else 0.0
+
+    def reset(self, now: float) -> None:
+        self._interval = self._min_interval
+        self._last_change = now
+        self._idle = False
+
+    def changed(self, now: float) -> bool:
+        resumed = self._idle
+        self.reset(now)
+        return resumed
+
+    def unchanged(self, now: float) -> bool:
+        if self._last_change is None:
+            self._last_change = now
+        if now - self._last_change < self._idle_after:
+            return False
+        entered = not self._idle
+        self._idle = True
+        base = max(self._interval, self._min_interval, 0.001)
+        self._interval = min(self._max_interval, base * self._backoff)
+        return entered
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self._rate = max(0.0, rate)
+        self._capacity = max(1.0, burst)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def delay(self, now: float | None = None) -> float:
+        if self._rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic() if now is None else now)
+            if self._tokens >= 1.0:
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
+
+    def consume(self, now: float | None = None) -> bool:
+        if self._rate <= 0:
+            return True
+        with self._lock:
+            self._refill(time.monotonic() if now is None else now)
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + max(0.0, now - self._updated) * self._rate)
+        self._updated = now
+
+
+class TranslationTicket:
+    __slots__ = ("text", "trace", "complete", "seq", "stale")
+
+    def __init__(self, text: str, trace, complete: bool, seq: int) -> None:
+        self.text = text
+        self.trace = trace
+        self.complete = complete
+        self.seq = seq
+        self.stale = False
+
+
+class TranslationScheduler:
+    def __init__(self, max_pending: int = 16) -> None:
+        self._max_pending = max(1, max_pending)
+        self._complete = deque()
+        self._partial = deque()
+        self._active_partial = []
+        self._seq = 0
+        self._cond = threading.Condition()
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._complete) + len(self._partial)
+
+    def submit(self, text: str, trace, complete: bool = True):
+        with self._cond:
+            self._seq += 1
+            ticket = TranslationTicket(text, trace, complete, self._seq)
+            superseded = self._supersede_partials()
+            dropped = []
+            if complete:
+                self._complete.append(ticket)
+                while len(self._complete) > self._max_pending:
+                    dropped.append(self._complete.popleft())
+            else:
+                self._partial.append(ticket)
+                self._active_partial.append(ticket)
+            self._cond.notify()
+            return superseded, dropped
+
+    def take(self, max_items: int, window: float, timeout: float) -> list:
+        with self._cond:
+            if not self._cond.wait_for(self._has_work, timeout=timeout):
+                return []
+            deadline = time.monotonic() + window
+            while len(self._complete) + len(self._partial) < max_items:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            tickets = []
+            while self._complete and len(tickets) < max_items:
+                tickets.append(self._complete.popleft())
+            while self._partial and len(tickets) < max_items:
+                tickets.append(self._partial.popleft())
+            return tickets
+
+    def done(self, tickets) -> None:
+        with self._cond:
+            finished = {id(ticket) for ticket in tickets}
+            self._active_partial = [
+                ticket for ticket in self._active_partial if id(ticket) not in finished
+            ]
+
+    def clear(self) -> None:
+        with self._cond:
+            for ticket in self._active_partial:
+                ticket.stale = True
+            self._complete.clear()
+            self._partial.clear()
+            self._active_partial = []
+
+    def _has_work(self) -> bool:
+        return bool(self._complete or self._partial)
+
+    def _supersede_partials(self) -> list:
+        superseded = list(self._partial)
+        for ticket in self._active_partial:
+            ticket.stale = True
+        self._partial.clear()
+        self._active_partial = []
+        return superseded
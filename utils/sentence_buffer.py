@@ -1,5 +1,4 @@
-import re
-from difflib import SequenceMatcher
+from utils.similarity import similarity_at_least
 
 
 class SentenceBuffer:
@@ -19,12 +18,18 @@ class SentenceBuffer:
         self._min_overlap = min_overlap
         self._split_on_no_overlap = split_on_no_overlap
         self._split_similarity = split_similarity
-        tail_chars = "\"')\\]」』】》）"
-        self._end_re = re.compile(
-            rf"[{re.escape(end_punct)}]+[{re.escape(tail_chars)}]*$"
-        )
+        self._end_punct = frozenset(end_punct)
+        self._tail_chars = frozenset("\"')\\]」』】》）")
         self._buffer = ""
+        self._buffer_lower = ""
         self._last_change = 0.0
+        self._pattern = ""
+        self._pattern_lower = ""
+        self._pattern_table = []
+
+    @property
+    def pending(self) -> str:
+        return self._buffer
 
     def update(self, text: str, now: float) -> list[str]:
         sentences = []
@@ -33,7 +38,7 @@ class SentenceBuffer:
             return sentences
 
         if not self._buffer:
-            self._buffer = text
+            self._set_buffer(text)
             self._last_change = now
             if self._is_complete(self._buffer):
                 sentences.append(self._buffer)
@@ -45,27 +50,25 @@ class SentenceBuffer:
             self.clear()
 
         if not self._buffer:
-            self._buffer = text
+            self._set_buffer(text)
             self._last_change = now
             if self._is_complete(self._buffer):
                 sentences.append(self._buffer)
                 self.clear()
             return sentences
 
-        overlap = self._overlap_len(self._buffer, text)
+        overlap = self._overlap_len(text)
         if overlap < self._min_overlap and self._split_on_no_overlap:
-            if self._similarity(self._buffer, text) < self._split_similarity:
+            if not similarity_at_least(self._buffer, text, self._split_similarity):
                 sentences.append(self._buffer)
-                self._buffer = text
+                self._set_buffer(text)
                 self._last_change = now
                 if self._is_complete(self._buffer):
                     sentences.append(self._buffer)
                     self.clear()
                 return sentences
 
-        merged = self._merge(self._buffer, text, overlap)
-        if merged != self._buffer:
-            self._buffer = merged
+        if self._merge(text, overlap):
             self._last_change = now
 
         if self._is_complete(self._buffer) or len(self._buffer) >= self._max_chars:
@@ -84,37 +87,91 @@ class SentenceBuffer:
             return [sentence]
         return []
 
+    def flush(self) -> list[str]:
+        if not self._buffer:
+            return []
+        sentence = self._buffer
+        self.clear()
+        return [sentence]
+
     def clear(self) -> None:
         self._buffer = ""
+        self._buffer_lower = ""
         self._last_change = 0.0
 
-    def _is_complete(self, text: str) -> bool:
-        return bool(self._end_re.search(text))
+    def _set_buffer(self, text: str, lower: str | None = None) -> None:
+        self._buffer = text
+        self._buffer_lower = text.lower() if lower is None else lower
 
-    def _overlap_len(self, prev: str, new: str) -> int:
+    def _is_complete(self, text: str) -> bool:
+        for ch in reversed(text):
+            if ch in self._end_punct:
+                return True
+            if ch not in self._tail_chars:
+                return False
+        return False
+
+    def _overlap_len(self, new: str) -> int:
+        prev = self._buffer
         if new.startswith(prev):
             return len(prev)
         if prev.startswith(new):
             return len(new)
 
-        prev_lower = prev.lower()
-        new_lower = new.lower()
-        max_k = min(len(prev_lower), len(new_lower))
-        for k in range(max_k, self._min_overlap - 1, -1):
-            if prev_lower[-k:] == new_lower[:k]:
-                return k
-        return 0
-
-    def _merge(self, prev: str, new: str, overlap_len: int) -> str:
+        pattern = new.lower() if new != self._pattern else self._pattern_lower
+        tail = self._buffer_lower[-len(pattern) :]
+        limit = len(tail) - self._min_overlap
+        pos = tail.find(pattern[0])
+        for _ in range(8):
+            if pos < 0 or pos > limit:
+                return 0
+            if pattern.startswith(tail[pos:]):
+                return len(tail) - pos
+            pos = tail.find(pattern[0], pos + 1)
+
+        pattern, table = self._prefix_table(new)
+        k = 0
+        for ch in tail:
+            while k and pattern[k] != ch:
+                k = table[k - 1]
+            if pattern[k] == ch:
+                k += 1
+        return k if k >= self._min_overlap else 0
+
+    def _prefix_table(self, new: str):
+        if new != self._pattern:
+            pattern = new.lower()
+            table = [0] * len(pattern)
+            k = 0
+            for i in range(1, len(pattern)):
+                ch = pattern[i]
+                while k and pattern[k] != ch:
+                    k = table[k - 1]
+                if pattern[k] == ch:
+                    k += 1
+                table[i] = k
+            self._pattern = new
+            self._pattern_lower = pattern
+            self._pattern_table = table
+        return self._pattern_lower, self._pattern_table
+
+    def _merge(self, new: str, overlap_len: int) -> bool:
+        prev = self._buffer
         if new.startswith(prev):
-            return new
+            if len(new) == len(prev):
+                return False
+            self._set_buffer(new, self._buffer_lower + new[len(prev) :].lower())
+            return True
         if prev.startswith(new):
-            return prev
+            return False
         if overlap_len >= self._min_overlap:
-            return prev + new[overlap_len:]
+            delta = new[overlap_len:]
+            if not delta:
+                return False
+            self._set_buffer(prev + delta, self._buffer_lower + delta.lower())
+            return True
 
         sep = "" if prev.endswith(" ") or new.startswith(" ") else " "
-        return prev + sep + new
-
-    def _similarity(self, a: str, b: str) -> float:
-        return SequenceMatcher(None, a, b).ratio()
+        delta = sep + new
+        self._set_buffer(prev + delta, self._buffer_lower + delta.lower())
+        return True
@@ -0,0 +1,107 @@
+import math
+from difflib import SequenceMatcher
+
+
+def _pattern_masks(text: str) -> dict:
+    peq = {}
+    for i, ch in enumerate(text):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    return peq
+
+
+def levenshtein(a: str, b: str, max_dist: int | None = None) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    if max_dist is None:
+        max_dist = len(a)
+    if len(a) - len(b) > max_dist:
+        return max_dist + 1
+    m = len(a)
+    if m == 0:
+        return 0
+    if not b:
+        return m
+
+    peq = _pattern_masks(a)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    remaining = len(b)
+    for ch in b:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        remaining -= 1
+        if score - remaining > max_dist:
+            return max_dist + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def _trim_affixes(a: str, b: str):
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < limit - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    return a[start : len(a) - end], b[start : len(b) - end], start + end
+
+
+def lcs_length(a: str, b: str, min_length: int = 0) -> int:
+    a, b, shared = _trim_affixes(a, b)
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(a)
+    if not b:
+        return shared
+    min_length -= shared
+
+    peq = _pattern_masks(a)
+    mask = (1 << m) - 1
+    v = mask
+    remaining = len(b)
+    for ch in b:
+        u = v & peq.get(ch, 0)
+        v = ((v + u) | (v - u)) & mask
+        remaining -= 1
+        if min_length > 0 and not remaining & 15 and m - v.bit_count() + remaining < min_length:
+            break
+    return shared + m - v.bit_count()
+
+
+def ratio(a: str, b: str) -> float:
+    if not a and not b:
+        return 1.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def similarity_at_least(a: str, b: str, threshold: float) -> bool:
+    total = len(a) + len(b)
+    if not total or a == b:
+        return True
+    if threshold <= 0.0:
+        return True
+    needed = math.ceil(threshold * total / 2.0 - 1e-9)
+    if min(len(a), len(b)) < needed:
+        return False
+    # SequenceMatcher's matching blocks form a common subsequence, so the LCS is an
+    # upper bound on its match count: rejecting on it never changes the decision.
+    # Pairs whose shared prefix and suffix already reach the target are likely
+    # matches, so they skip the bound and go straight to the exact ratio.
+    _a, _b, shared = _trim_affixes(a, b)
+    if shared < needed and lcs_length(a, b, min_length=needed) < needed:
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= threshold
@@ -0,0 +1,19 @@
+import time
+
+_STARTED = time.perf_counter()
+_MARKS = {}
+
+
+def mark(name: str) -> bool:
+    if name in _MARKS:
+        return False
+    _MARKS[name] = time.perf_counter() - _STARTED
+    return True
+
+
+def report() -> dict:
+    return {name: round(seconds, 3) for name, seconds in _MARKS.items()}
+
+
+def summary() -> str:
+    return ", ".join(f"{name} {seconds:.2f}s" for name, seconds in report().items())
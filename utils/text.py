@@ -1,5 +1,6 @@
 import re
-from difflib import SequenceMatcher
+
+from utils.similarity import ratio
 
 
 _whitespace_re = re.compile(r"\s+")
@@ -15,6 +16,4 @@ def normalize_text(text: str) -> str:
 
 
 def similarity(a: str, b: str) -> float:
-    if not a and not b:
-        return 1.0
-    return SequenceMatcher(None, a, b).ratio()
+    return ratio(a, b)
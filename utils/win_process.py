@@ -3,27 +3,34 @@ import os
 from ctypes import wintypes
 
 
-_USER32 = ctypes.WinDLL("user32", use_last_error=True)
-_KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
 _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
 
-_USER32.GetForegroundWindow.restype = wintypes.HWND
-_USER32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
-_USER32.GetWindowThreadProcessId.restype = wintypes.DWORD
-_KERNEL32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
-_KERNEL32.OpenProcess.restype = wintypes.HANDLE
-_KERNEL32.QueryFullProcessImageNameW.argtypes = (
-    wintypes.HANDLE,
-    wintypes.DWORD,
-    wintypes.LPWSTR,
-    ctypes.POINTER(wintypes.DWORD),
-)
-_KERNEL32.QueryFullProcessImageNameW.restype = wintypes.BOOL
-_KERNEL32.CloseHandle.argtypes = (wintypes.HANDLE,)
-_KERNEL32.CloseHandle.restype = wintypes.BOOL
+if os.name == "nt":
+    _USER32 = ctypes.WinDLL("user32", use_last_error=True)
+    _KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _USER32.GetForegroundWindow.restype = wintypes.HWND
+    _USER32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, ctypes.POINTER(wintypes.DWORD))
+    _USER32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    _KERNEL32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _KERNEL32.OpenProcess.restype = wintypes.HANDLE
+    _KERNEL32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.LPWSTR,
+        ctypes.POINTER(wintypes.DWORD),
+    )
+    _KERNEL32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+    _KERNEL32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _KERNEL32.CloseHandle.restype = wintypes.BOOL
+else:
+    _USER32 = None
+    _KERNEL32 = None
 
 
 def get_foreground_process_path() -> str | None:
+    if _USER32 is None:
+        return None
     hwnd = _USER32.GetForegroundWindow()
     if not hwnd:
         return None